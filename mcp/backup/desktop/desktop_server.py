@@ -27,8 +27,9 @@ import sys
 import platform
 import psutil
 import subprocess
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from pathlib import Path
+from types import MappingProxyType
 import pyperclip  # For clipboard operations
 import plyer  # For notifications
 
@@ -50,7 +51,12 @@ logger = logging.getLogger(__name__)
 MCP_VERSION = "2024-11-05"
 JSONRPC_VERSION = "2.0"
 
+# Shared read-only params for requests that omit them
+_EMPTY_PARAMS = MappingProxyType({})
+
 class MCPMessage:
+    __slots__ = ("jsonrpc", "id", "method", "params", "result", "error")
+
     def __init__(self, jsonrpc: str = JSONRPC_VERSION, id: Optional[str] = None,
                  method: Optional[str] = None, params: Optional[Dict[str, Any]] = None,
                  result: Optional[Any] = None, error: Optional[Dict[str, Any]] = None):
@@ -79,6 +85,9 @@ class MCPMessage:
         return json.dumps(self.to_dict())
 
 class MCPTool:
+    # Subclasses declare an empty __slots__ so instances stay dict-free
+    __slots__ = ("name", "description", "parameters")
+
     def __init__(self, name: str, description: str, parameters: Dict[str, Any]):
         self.name = name
         self.description = description
@@ -88,6 +97,8 @@ class MCPTool:
         raise NotImplementedError("Tool execution not implemented")
 
 class FileOperationsTool(MCPTool):
+    __slots__ = ()
+
     def __init__(self):
         # Load configuration
         config_loader = get_config_loader()
@@ -175,6 +186,8 @@ class FileOperationsTool(MCPTool):
             raise Exception(f"Unknown operation: {operation}")
 
 class SystemInfoTool(MCPTool):
+    __slots__ = ()
+
     def __init__(self):
         # Load configuration
         config_loader = get_config_loader()
@@ -258,6 +271,8 @@ class SystemInfoTool(MCPTool):
             raise Exception(f"Unknown category: {category}")
 
 class ClipboardTool(MCPTool):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "clipboard",
@@ -296,6 +311,8 @@ class ClipboardTool(MCPTool):
             raise Exception(f"Unknown operation: {operation}")
 
 class NotificationTool(MCPTool):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "notification",
@@ -323,6 +340,8 @@ class NotificationTool(MCPTool):
             raise Exception(f"Failed to send notification: {str(e)}")
 
 class ApplicationTool(MCPTool):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "application",
@@ -410,19 +429,25 @@ class MCPDesktopServer:
                 if tool_name in tool_classes:
                     try:
                         self.tools[tool_name] = tool_classes[tool_name]()
-                        logger.info(f"✅ Registered tool: {tool_name}")
+                        logger.info("✅ Registered tool: %s", tool_name)
                     except Exception as e:
-                        logger.error(f"❌ Failed to register tool {tool_name}: {e}")
+                        logger.error("❌ Failed to register tool %s: %s", tool_name, e)
                 else:
-                    logger.warning(f"⚠️  No implementation found for tool: {tool_name}")
+                    logger.warning("⚠️  No implementation found for tool: %s", tool_name)
         else:
             logger.warning("⚠️  No desktop server configuration found, using default tools")
             # Fallback to default tools if config is missing
-            self.tools["file_operations"] = FileOperationsTool()
-            self.tools["system_info"] = SystemInfoTool()
-            self.tools["clipboard"] = ClipboardTool()
-            self.tools["notification"] = NotificationTool()
-            self.tools["application"] = ApplicationTool()
+            self.register_tools([
+                FileOperationsTool(),
+                SystemInfoTool(),
+                ClipboardTool(),
+                NotificationTool(),
+                ApplicationTool()
+            ])
+
+    def register_tools(self, tools: Iterable[MCPTool]):
+        """Register several tools in one pass"""
+        self.tools.update((tool.name, tool) for tool in tools)
 
     def _register_resources(self):
         """Register available resources"""
@@ -466,7 +491,7 @@ class MCPDesktopServer:
 
     async def handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle initialization request"""
-        logger.info(f"Initializing desktop server with client: {params.get('clientInfo', {})}")
+        logger.info("Initializing desktop server with client: %s", params.get('clientInfo', {}))
 
         return {
             "protocolVersion": MCP_VERSION,
@@ -493,7 +518,7 @@ class MCPDesktopServer:
         tool_name = params.get("name")
         tool_args = params.get("arguments", {})
 
-        logger.info(f"Executing tool: {tool_name} with args: {tool_args}")
+        logger.info("Executing tool: %s with args: %s", tool_name, tool_args)
 
         if tool_name not in self.tools:
             raise Exception(f"Tool '{tool_name}' not found")
@@ -532,17 +557,18 @@ class MCPDesktopServer:
 
     async def process_message(self, message: MCPMessage) -> MCPMessage:
         """Process an incoming MCP message"""
+        params = message.params if message.params is not None else _EMPTY_PARAMS
         try:
             if message.method == "initialize":
-                result = await self.handle_initialize(message.params or {})
+                result = await self.handle_initialize(params)
             elif message.method == "tools/list":
                 result = await self.handle_tools_list()
             elif message.method == "tools/call":
-                result = await self.handle_tools_call(message.params or {})
+                result = await self.handle_tools_call(params)
             elif message.method == "resources/list":
                 result = await self.handle_resources_list()
             elif message.method == "resources/read":
-                result = await self.handle_resources_read(message.params or {})
+                result = await self.handle_resources_read(params)
             else:
                 raise Exception(f"Unknown method: {message.method}")
 
@@ -553,7 +579,7 @@ class MCPDesktopServer:
             )
 
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
+            logger.error("Error processing message: %s", e)
             return MCPMessage(
                 jsonrpc=JSONRPC_VERSION,
                 id=message.id,
@@ -570,10 +596,12 @@ async def handle_stdio():
     """Handle STDIO communication for MCP clients"""
     logger.info("Starting Desktop MCP server in STDIO mode")
 
+    loop = asyncio.get_running_loop()
+
     try:
         while True:
             # Read from stdin
-            line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
+            line = await loop.run_in_executor(None, sys.stdin.readline)
             if not line:
                 break
 
@@ -592,9 +620,9 @@ async def handle_stdio():
                 print(response.json(), flush=True)
 
             except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON received: {e}")
+                logger.error("Invalid JSON received: %s", e)
             except Exception as e:
-                logger.error(f"Error processing STDIO message: {e}")
+                logger.error("Error processing STDIO message: %s", e)
 
     except KeyboardInterrupt:
         logger.info("Desktop server stopped")
@@ -609,7 +637,7 @@ def main():
         import pyperclip
         import plyer
     except ImportError as e:
-        logger.error(f"Missing required dependencies: {e}")
+        logger.error("Missing required dependencies: %s", e)
         logger.error("Please install with: pip install pyperclip plyer")
         sys.exit(1)
 
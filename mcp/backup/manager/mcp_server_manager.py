@@ -5,46 +5,272 @@ Master builder for orchestrating multiple MCP servers and managing connections.
 """
 
 import asyncio
-import json
+import hashlib
 import logging
 import os
+import random
 import subprocess
 import sys
-from typing import Any, Dict, List, Optional, Union
+import time
+from itertools import islice
+from typing import Any, Dict, List, Literal, Optional, Union
 from pathlib import Path
 
+import aiohttp
+import orjson
 import psutil
-import requests
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from mcp.server import FastMCP
+from pydantic import ConfigDict, TypeAdapter, ValidationError, create_model
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parsed config files keyed by path -> (st_mtime_ns, config)
+_CONFIG_CACHE: Dict[str, tuple] = {}
+
+# Request bodies are pre-encoded with orjson and sent as raw bytes
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Upper bound on bytes returned by a desktop file_operations read
+_MAX_READ_BYTES = 1_048_576
+
+_SCHEMA_TYPES = {
+    'string': str,
+    'integer': int,
+    'number': float,
+    'boolean': bool,
+    'array': list,
+    'object': dict
+}
+
+def _build_param_adapter(tool_name: str, schema: Dict[str, Any]) -> TypeAdapter:
+    """Compile a tool's JSON schema into a reusable pydantic validator."""
+    properties = schema.get('properties')
+    if not properties:
+        return TypeAdapter(Dict[str, Any])
+
+    required = set(schema.get('required', []))
+    fields = {}
+    for prop, spec in properties.items():
+        if 'enum' in spec:
+            annotation = Literal[tuple(spec['enum'])]
+        else:
+            annotation = _SCHEMA_TYPES.get(spec.get('type'), Any)
+        if prop in required:
+            fields[prop] = (annotation, ...)
+        else:
+            fields[prop] = (Optional[annotation], spec.get('default'))
+
+    model = create_model(f"{tool_name}_params", __config__=ConfigDict(extra='allow', strict=True), **fields)
+    return TypeAdapter(model)
+
 class MCPServerManager:
     """Master MCP server manager for orchestrating multiple MCP servers."""
 
-    def __init__(self, config_path: str = "servers/mcp-config-expanded.json"):
+    # Minimum seconds between psutil samples of the same server process
+    PROCESS_SAMPLE_INTERVAL = 0.5
+    # Seconds to wait for a remote server's /health, and the backoff bounds between probes
+    REMOTE_STARTUP_TIMEOUT = 60.0
+    HEALTH_POLL_INITIAL = 0.05
+    HEALTH_POLL_MAX = 2.0
+
+    def __init__(self, config_path: str = "servers/mcp-config-expanded.json",
+                 pool_size: int = 100):
         self.config_path = config_path
         self.config = self._load_config()
         self.running_servers = {}
+        self._build_server_index()
         self.server_processes = {}
+        self._base_env = dict(os.environ)
         self.server_connections = {}
+        self.pool_size = pool_size
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._psutil_processes: Dict[str, psutil.Process] = {}
+        self._system_resources = {'cpu_percent': 0.0, 'memory_percent': 0.0, 'disk_percent': 0.0}
+        self._sampler_task: Optional[asyncio.Task] = None
+        self._response_cache: Dict[str, tuple] = {}
+        self._cache_locks: Dict[str, asyncio.Lock] = {}
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self._proc_sample_cache: Dict[int, tuple] = {}
+        self._background_tasks: set = set()
+
+    async def startup(self):
+        """Create the shared HTTP session and start background sampling."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=20,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
+            )
+        self._install_child_watcher()
+        self._ensure_sampler()
+
+    @staticmethod
+    def _install_child_watcher():
+        """Reap desktop server children via pidfds instead of a thread per spawn.
+
+        Requires Linux >= 5.3; on other platforms or older kernels the
+        default child watcher is left in place. Python 3.12+ already reaps via
+        pidfds and deprecates the child watcher API, so nothing is done there.
+        """
+        if sys.version_info >= (3, 12) or not sys.platform.startswith('linux'):
+            return
+        if not hasattr(asyncio, 'PidfdChildWatcher'):
+            return
+        try:
+            policy = asyncio.get_event_loop_policy()
+            if isinstance(policy.get_child_watcher(), asyncio.PidfdChildWatcher):
+                return
+            watcher = asyncio.PidfdChildWatcher()
+            watcher.attach_loop(asyncio.get_running_loop())
+            policy.set_child_watcher(watcher)
+        except (AttributeError, NotImplementedError, OSError) as e:
+            logger.debug(f"Keeping default child watcher: {str(e)}")
+
+    async def shutdown(self):
+        """Close the shared HTTP session and stop background sampling."""
+        if self._sampler_task is not None:
+            self._sampler_task.cancel()
+            self._sampler_task = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _ensure_sampler(self):
+        """Start the system resource sampler if it is not already running."""
+        if self._sampler_task is None or self._sampler_task.done():
+            self._sampler_task = asyncio.get_running_loop().create_task(self._resource_sampler())
+
+    async def _resource_sampler(self):
+        """Refresh system CPU/memory/disk usage once per second off the event loop."""
+        while True:
+            try:
+                cpu = await asyncio.to_thread(psutil.cpu_percent, 1.0)
+                self._system_resources = {
+                    'cpu_percent': cpu,
+                    'memory_percent': psutil.virtual_memory().percent,
+                    'disk_percent': psutil.disk_usage('/').percent
+                }
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Resource sampling failed: {str(e)}")
+                await asyncio.sleep(1)
+
+    async def _cached(self, key: str, ttl: float, producer) -> Dict[str, Any]:
+        """Return a recent result for key, recomputing at most once per ttl.
+
+        Concurrent callers that miss the cache wait on a per-key lock so only
+        one of them runs the producer; the rest reuse its result.
+        """
+        cached = self._response_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._response_cache.get(key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+            result = await producer()
+            if 'error' not in result:
+                self._response_cache[key] = (time.monotonic(), result)
+            return result
+
+    def _invalidate_status_cache(self):
+        """Drop cached status/health snapshots after a server starts or stops."""
+        self._response_cache.clear()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it if startup was skipped."""
+        if self._session is None or self._session.closed:
+            await self.startup()
+        return self._session
+
+    def _read_config(self) -> Dict[str, Any]:
+        """Parse the config file, reusing the last parse while its mtime is unchanged."""
+        mtime = os.stat(self.config_path).st_mtime_ns
+        cached = _CONFIG_CACHE.get(self.config_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with open(self.config_path, 'rb') as f:
+            config = orjson.loads(f.read())
+        _CONFIG_CACHE[self.config_path] = (mtime, config)
+        return config
 
     def _load_config(self) -> Dict[str, Any]:
-        """Load MCP server configuration."""
+        """Load MCP server configuration, reparsing only when the file changes."""
         try:
-            with open(self.config_path, 'r') as f:
-                return json.load(f)
+            return self._read_config()
         except FileNotFoundError:
             logger.warning(f"Config file {self.config_path} not found, using default config")
             return self._get_default_config()
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Invalid JSON in config file: {e}")
             return self._get_default_config()
 
+    def _build_server_index(self):
+        """Precompute per-server type/tool views so listings skip config walks."""
+        self._server_index = {}
+        self._param_adapters = {}
+        for name, config in self.config['mcpServers'].items():
+            tools = config.get('tools', {})
+            if isinstance(tools, dict):
+                for tool_name, tool_config in tools.items():
+                    if isinstance(tool_config, dict) and 'schema' in tool_config:
+                        try:
+                            adapter = _build_param_adapter(tool_name, tool_config['schema'])
+                        except Exception as e:
+                            # A bad schema should not take the manager down; the
+                            # tool is then called without parameter validation
+                            logger.warning(f"Invalid schema for tool {tool_name} on {name}, "
+                                           f"skipping validation: {str(e)}")
+                            adapter = TypeAdapter(Dict[str, Any])
+                        self._param_adapters[(name, tool_name)] = adapter
+            self._server_index[name] = {
+                'type': config['type'],
+                'tools': tools,
+                'tool_count': len(tools)
+            }
+        self._total_tools = sum(entry['tool_count'] for entry in self._server_index.values())
+        self._status_view = {name: self._status_entry(name) for name in self._server_index}
+
+    def _status_entry(self, name: str) -> Dict[str, Any]:
+        """Build the status entry for one server from config and running state."""
+        entry = {
+            'name': name,
+            'type': self._server_index[name]['type'],
+            'running': name in self.running_servers,
+            'config': self.config['mcpServers'][name]
+        }
+        if name in self.running_servers:
+            entry.update(self.running_servers[name])
+        return entry
+
+    def reload_config(self):
+        """Reload the config file if it changed and refresh derived indexes."""
+        try:
+            config = self._read_config()
+        except FileNotFoundError:
+            return
+        except orjson.JSONDecodeError as e:
+            # Likely a half-saved edit; keep serving the last good config
+            logger.error(f"Invalid JSON in config file, keeping current config: {e}")
+            return
+        if config is not self.config:
+            self.config = config
+            self._build_server_index()
+            self._invalidate_status_cache()
+
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default MCP server configuration."""
         return {
@@ -62,13 +288,17 @@ class MCPServerManager:
             "globalConfig": {
                 "maxConcurrentConnections": 10,
                 "defaultTimeout": 30,
-                "enableLogging": True
+                "enableLogging": True,
+                "healthCacheTtl": 0.5,
+                "maxConcurrentStarts": 8
             }
         }
 
     async def start_server(self, server_name: str) -> Dict[str, Any]:
         """Start a specific MCP server."""
         try:
+            # Pick up config edits; a stat call when the file is unchanged
+            self.reload_config()
             if server_name not in self.config['mcpServers']:
                 return {'error': f'Server {server_name} not found in configuration'}
 
@@ -87,6 +317,8 @@ class MCPServerManager:
 
             if result['success']:
                 self.running_servers[server_name] = server_config
+                self._status_view[server_name] = self._status_entry(server_name)
+                self._invalidate_status_cache()
                 logger.info(f"Started MCP server: {server_name}")
 
             return result
@@ -99,8 +331,7 @@ class MCPServerManager:
         """Start a desktop MCP server."""
         try:
             cmd = [server_config['command']] + server_config.get('args', [])
-            env = os.environ.copy()
-            env.update(server_config.get('env', {}))
+            env = {**self._base_env, **server_config.get('env', {})}
 
             # Start process
             process = await asyncio.create_subprocess_exec(
@@ -112,11 +343,19 @@ class MCPServerManager:
             )
 
             self.server_processes[server_config['name']] = process
-
-            # Wait a bit for server to start
-            await asyncio.sleep(2)
-
-            if process.returncode is None:  # Process is still running
+            try:
+                # Prime per-process CPU accounting; the first reading is always 0.0
+                ps_proc = psutil.Process(process.pid)
+                ps_proc.cpu_percent(interval=None)
+                self._psutil_processes[server_config['name']] = ps_proc
+            except psutil.Error:
+                pass
+
+            # Only wait long enough to catch an immediate crash
+            warmup = self.config.get('globalConfig', {}).get('startupWarmup', 0.25)
+            exited = await self._wait_for_exit(process, warmup)
+
+            if not exited:  # Process is still running
                 return {
                     'success': True,
                     'server': server_config['name'],
@@ -136,6 +375,37 @@ class MCPServerManager:
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
+    async def _wait_for_exit(self, process: asyncio.subprocess.Process, timeout: float) -> bool:
+        """Wait up to timeout seconds for a child to exit; return True if it did."""
+        pidfd_open = getattr(os, 'pidfd_open', None)
+        fd = None
+        if pidfd_open is not None:
+            try:
+                fd = pidfd_open(process.pid)
+            except OSError:
+                fd = None
+
+        if fd is None:
+            # No pidfd (macOS, Windows, old kernels): rely on the loop's child watcher
+            try:
+                await asyncio.wait_for(asyncio.shield(process.wait()), timeout)
+                return True
+            except asyncio.TimeoutError:
+                return False
+
+        # Linux: the pidfd becomes readable the moment the child exits
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+        loop.add_reader(fd, lambda: exited.done() or exited.set_result(True))
+        try:
+            await asyncio.wait_for(exited, timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            loop.remove_reader(fd)
+            os.close(fd)
+
     async def _start_remote_server(self, server_config: Dict[str, Any]) -> Dict[str, Any]:
         """Start a remote MCP server."""
         try:
@@ -186,13 +456,17 @@ class MCPServerManager:
                 subprocess.run(ssh_cmd, check=True)
                 logger.info(f"Started server via SSH: {ssh_host}")
 
-            # Wait for server to be ready
-            import time
-            max_attempts = 30
-            for attempt in range(max_attempts):
+            # Wait for server to be ready, backing off exponentially so a fast
+            # start is seen within milliseconds without hammering a slow one
+            session = await self._get_session()
+            deadline = time.monotonic() + self.REMOTE_STARTUP_TIMEOUT
+            interval = self.HEALTH_POLL_INITIAL
+            while True:
                 try:
-                    response = requests.get(f"http://{host}:{port}/health", timeout=5)
-                    if response.status_code == 200:
+                    async with session.get(f"http://{host}:{port}/health",
+                                           timeout=aiohttp.ClientTimeout(total=5)) as response:
+                        status = response.status
+                    if status == 200:
                         return {
                             'success': True,
                             'server': server_config['name'],
@@ -202,10 +476,14 @@ class MCPServerManager:
                             'status': 'running',
                             'startup_method': startup_method
                         }
-                except requests.exceptions.RequestException:
+                except (aiohttp.ClientError, asyncio.TimeoutError):
                     pass
 
-                time.sleep(2)  # Wait 2 seconds before retry
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(min(interval, remaining))
+                interval = min(interval * 2, self.HEALTH_POLL_MAX)
 
             return {
                 'success': False,
@@ -223,6 +501,35 @@ class MCPServerManager:
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
+    async def start_all(self) -> Dict[str, Any]:
+        """Start every configured server concurrently."""
+        return await self._run_bulk(self.start_server, list(self.config['mcpServers']))
+
+    async def stop_all(self) -> Dict[str, Any]:
+        """Stop every running server concurrently.
+
+        stop_server bounds each stop itself (terminate, then kill after 10s), so
+        no outer timeout is applied; cancelling a stop midway would leave the
+        process and status tables out of step.
+        """
+        return await self._run_bulk(self.stop_server, list(self.running_servers))
+
+    async def _run_bulk(self, action, names: List[str]) -> Dict[str, Any]:
+        """Run action for each server name, bounded by globalConfig.maxConcurrentStarts."""
+        limit = self.config.get('globalConfig', {}).get('maxConcurrentStarts', 8)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(name):
+            async with semaphore:
+                return await action(name)
+
+        # Failures are reported per server so one never cancels its siblings
+        results = await asyncio.gather(*(run(name) for name in names), return_exceptions=True)
+        return {
+            name: {'error': str(result), 'server': name} if isinstance(result, Exception) else result
+            for name, result in zip(names, results)
+        }
+
     async def stop_server(self, server_name: str) -> Dict[str, Any]:
         """Stop a specific MCP server."""
         try:
@@ -242,17 +549,24 @@ class MCPServerManager:
                         await process.wait()
 
                 del self.server_processes[server_config['name']]
+                self._psutil_processes.pop(server_config['name'], None)
+                self._proc_sample_cache.pop(process.pid, None)
 
             elif server_config['type'] == 'remote':
                 # For remote servers, we might need to call a shutdown endpoint
                 host = server_config.get('host', 'digitalhustlelab.com')
                 port = server_config.get('port', 3000)
-                try:
-                    requests.post(f"http://{host}:{port}/shutdown", timeout=5)
-                except:
-                    pass  # Ignore shutdown request failures
+                task = asyncio.create_task(self._request_remote_shutdown(f"http://{host}:{port}/shutdown"))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
 
             del self.running_servers[server_name]
+            if server_name in self._server_index:
+                self._status_view[server_name] = self._status_entry(server_name)
+            else:
+                # Removed from the config by a reload while it was running
+                self._status_view.pop(server_name, None)
+            self._invalidate_status_cache()
             logger.info(f"Stopped MCP server: {server_name}")
 
             return {
@@ -265,6 +579,15 @@ class MCPServerManager:
             logger.error(f"Failed to stop server {server_name}: {str(e)}")
             return {'error': str(e), 'server': server_name}
 
+    async def _request_remote_shutdown(self, url: str):
+        """Ask a remote server to shut down; the result is not awaited by callers."""
+        try:
+            session = await self._get_session()
+            async with session.post(url, timeout=aiohttp.ClientTimeout(total=2)):
+                pass
+        except Exception:
+            pass  # Ignore shutdown request failures
+
     async def get_server_status(self, server_name: str = None) -> Dict[str, Any]:
         """Get status of MCP servers."""
         try:
@@ -288,21 +611,9 @@ class MCPServerManager:
                 return status_info
 
             else:
-                # Return status of all servers
-                all_status = {}
-                for name, config in self.config['mcpServers'].items():
-                    all_status[name] = {
-                        'name': name,
-                        'type': config['type'],
-                        'running': name in self.running_servers,
-                        'config': config
-                    }
-                    if name in self.running_servers:
-                        all_status[name].update(self.running_servers[name])
-
                 return {
-                    'servers': all_status,
-                    'total_servers': len(self.config['mcpServers']),
+                    'servers': dict(self._status_view),
+                    'total_servers': len(self._server_index),
                     'running_servers': len(self.running_servers)
                 }
 
@@ -314,30 +625,26 @@ class MCPServerManager:
         """List available tools from MCP servers."""
         try:
             if server_name:
-                if server_name not in self.config['mcpServers']:
+                entry = self._server_index.get(server_name)
+                if entry is None:
                     return {'error': f'Server {server_name} not found'}
 
-                server_config = self.config['mcpServers'][server_name]
-                tools = server_config.get('tools', {})
-
                 return {
                     'server': server_name,
-                    'tools': tools,
-                    'tool_count': len(tools)
+                    'tools': entry['tools'],
+                    'tool_count': entry['tool_count']
                 }
 
             else:
                 # List tools from all servers
-                all_tools = {}
-                for name, config in self.config['mcpServers'].items():
-                    all_tools[name] = {
-                        'tools': config.get('tools', {}),
-                        'tool_count': len(config.get('tools', {}))
-                    }
+                all_tools = {
+                    name: {'tools': entry['tools'], 'tool_count': entry['tool_count']}
+                    for name, entry in self._server_index.items()
+                }
 
                 return {
                     'servers': all_tools,
-                    'total_tools': sum(len(config.get('tools', {})) for config in self.config['mcpServers'].values())
+                    'total_tools': self._total_tools
                 }
 
         except Exception as e:
@@ -353,37 +660,71 @@ class MCPServerManager:
 
             server_config = self.running_servers[server_name]
 
-            # Real MCP tool execution - forward to actual server
-            import aiohttp
-
-            server_url = server_config.get('endpoint', f"http://localhost:{server_config.get('port', 3000)}")
-
-            async with aiohttp.ClientSession() as session:
-                payload = {
-                    'tool_name': tool_name,
-                    'parameters': parameters,
-                    'server_type': server_config['type']
-                }
-
-                async with session.post(f"{server_url}/tools/execute", json=payload) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result
-                    else:
-                        error_text = await response.text()
-                        return {'error': f'Server error: {response.status} - {error_text}'}
-
-            return {
-                'server': server_name,
-                'tool': tool_name,
-                'result': result,
-                'timestamp': asyncio.get_event_loop().time()
-            }
+            adapter = self._param_adapters.get((server_name, tool_name))
+            if adapter is not None:
+                try:
+                    validated = adapter.validate_python(parameters)
+                except ValidationError as e:
+                    return {'error': f'Invalid parameters: {str(e)}', 'server': server_name, 'tool': tool_name}
+                if not isinstance(validated, dict):
+                    validated = validated.model_dump(exclude_unset=True)
+                parameters = validated
+
+            if not self._is_idempotent(server_config, tool_name):
+                return await self._forward_tool(server_config, tool_name, parameters)
+
+            # Identical idempotent calls already in flight share one request. It runs
+            # as its own task, so cancelling any one caller leaves the others waiting
+            key = (server_name, tool_name, orjson.dumps(parameters, option=orjson.OPT_SORT_KEYS))
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.create_task(self._forward_tool(server_config, tool_name, parameters))
+                self._inflight[key] = task
+                task.add_done_callback(lambda t: self._finish_inflight(key, t))
+            return await asyncio.shield(task)
 
         except Exception as e:
             logger.error(f"Failed to execute tool {tool_name} on {server_name}: {str(e)}")
             return {'error': str(e), 'server': server_name, 'tool': tool_name}
 
+    def _finish_inflight(self, key: tuple, task: asyncio.Task):
+        """Forget a finished shared call so the next identical call runs afresh."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark retrieved so a call whose callers all left does not log a warning
+            task.exception()
+
+    @staticmethod
+    def _is_idempotent(server_config: Dict[str, Any], tool_name: str) -> bool:
+        """Whether the config marks a tool as safe to share between callers."""
+        tools = server_config.get('tools', {})
+        if not isinstance(tools, dict):
+            return False
+        return bool(tools.get(tool_name, {}).get('idempotent', False))
+
+    async def _forward_tool(self, server_config: Dict[str, Any], tool_name: str,
+                            parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Forward a tool call to the running server over the shared session."""
+        # Real MCP tool execution - forward to actual server
+        server_url = server_config.get('endpoint', f"http://localhost:{server_config.get('port', 3000)}")
+        session = await self._get_session()
+
+        payload = {
+            'tool_name': tool_name,
+            'parameters': parameters,
+            'server_type': server_config['type']
+        }
+
+        async with session.post(f"{server_url}/tools/execute", data=orjson.dumps(payload),
+                                headers=_JSON_HEADERS,
+                                timeout=aiohttp.ClientTimeout(total=30)) as response:
+            if response.status == 200:
+                return orjson.loads(await response.read())
+            else:
+                error_text = await response.text()
+                return {'error': f'Server error: {response.status} - {error_text}'}
+
     async def _execute_desktop_tool(self, server_config: Dict[str, Any],
                                    tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute tool on desktop server."""
@@ -396,7 +737,8 @@ class MCPServerManager:
 
             if operation == 'list':
                 try:
-                    items = os.listdir(path)
+                    limit = parameters.get('limit', 1000)
+                    items = await asyncio.to_thread(self._list_directory, path, limit)
                     return {
                         'operation': 'list',
                         'path': path,
@@ -408,13 +750,21 @@ class MCPServerManager:
 
             elif operation == 'read':
                 try:
-                    with open(path, 'r') as f:
-                        content = f.read()
+                    max_bytes = parameters.get('max_bytes', _MAX_READ_BYTES)
+                    if not isinstance(max_bytes, int) or isinstance(max_bytes, bool):
+                        return {'error': 'max_bytes must be an integer'}
+                    # Negative values would make read() return the whole file
+                    max_bytes = max(0, min(max_bytes, _MAX_READ_BYTES))
+                    data, file_size, digest = await asyncio.to_thread(self._read_capped, path, max_bytes)
+                    content = data.decode('utf-8', errors='replace')
                     return {
                         'operation': 'read',
                         'path': path,
                         'content': content,
-                        'size': len(content)
+                        'size': len(data),
+                        'file_size': file_size,
+                        'truncated': file_size > len(data),
+                        'blake2b': digest
                     }
                 except Exception as e:
                     return {'error': str(e)}
@@ -429,6 +779,21 @@ class MCPServerManager:
 
         return {'error': f'Unknown tool: {tool_name}'}
 
+    @staticmethod
+    def _list_directory(path: str, limit: int) -> List[str]:
+        """List up to limit entry names without materializing the whole directory."""
+        with os.scandir(path) as entries:
+            return list(islice((entry.name for entry in entries), limit))
+
+    @staticmethod
+    def _read_capped(path: str, max_bytes: int) -> tuple:
+        """Read at most max_bytes of a file; returns (data, file size, blake2b of data)."""
+        with open(path, 'rb') as f:
+            file_size = os.fstat(f.fileno()).st_size
+            data = f.read(max_bytes)
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return data, file_size, digest
+
     async def _execute_remote_tool(self, server_config: Dict[str, Any],
                                   tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute tool on remote server."""
@@ -438,57 +803,94 @@ class MCPServerManager:
 
         try:
             # Make HTTP request to remote server
-            response = requests.post(
+            session = await self._get_session()
+            async with session.post(
                 f"http://{host}:{port}/execute_tool",
-                json={
+                data=orjson.dumps({
                     'tool': tool_name,
                     'parameters': parameters
-                },
-                timeout=30
-            )
-
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {'error': f'HTTP {response.status_code}: {response.text}'}
+                }),
+                headers=_JSON_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    return orjson.loads(await response.read())
+                else:
+                    return {'error': f'HTTP {response.status}: {await response.text()}'}
 
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             return {'error': f'Request failed: {str(e)}'}
 
+    @staticmethod
+    def _sample_process(proc: psutil.Process) -> Optional[Dict[str, Any]]:
+        """Read CPU and memory usage for one process in a single /proc pass."""
+        try:
+            return proc.as_dict(attrs=['cpu_percent', 'memory_percent'])
+        except psutil.NoSuchProcess:
+            return None
+
     async def get_system_health(self) -> Dict[str, Any]:
         """Get overall system health and statistics."""
+        ttl = self.config.get('globalConfig', {}).get('healthCacheTtl', 0.5)
+        return await self._cached('system_health', ttl, self._collect_system_health)
+
+    async def _collect_system_health(self) -> Dict[str, Any]:
+        """Sample system and per-server resource usage."""
         try:
             health_info = {
-                'timestamp': asyncio.get_event_loop().time(),
+                'timestamp': time.monotonic(),
                 'total_servers': len(self.config['mcpServers']),
                 'running_servers': len(self.running_servers),
-                'system_resources': {
-                    'cpu_percent': psutil.cpu_percent(interval=1),
-                    'memory_percent': psutil.virtual_memory().percent,
-                    'disk_percent': psutil.disk_usage('/').percent
-                },
+                'system_resources': dict(self._system_resources),
                 'server_processes': {}
             }
+            self._ensure_sampler()
 
-            # Get process info for running servers
+            # Get process info for running servers, sampling /proc in parallel
+            live = []
             for name, process in self.server_processes.items():
                 if process.returncode is None:
-                    try:
-                        proc = psutil.Process(process.pid)
-                        health_info['server_processes'][name] = {
-                            'pid': process.pid,
-                            'cpu_percent': proc.cpu_percent(),
-                            'memory_percent': proc.memory_percent(),
-                            'status': 'running'
-                        }
-                    except psutil.NoSuchProcess:
-                        health_info['server_processes'][name] = {'status': 'process_not_found'}
+                    proc = self._psutil_processes.get(name)
+                    if proc is None or proc.pid != process.pid:
+                        try:
+                            proc = psutil.Process(process.pid)
+                        except psutil.NoSuchProcess:
+                            health_info['server_processes'][name] = {'status': 'process_not_found'}
+                            continue
+                        self._psutil_processes[name] = proc
+                    live.append((name, proc))
                 else:
                     health_info['server_processes'][name] = {
                         'returncode': process.returncode,
                         'status': 'stopped'
                     }
 
+            # Re-poll a PID only after a jittered interval so bursts of health
+            # checks do not all hit /proc at once
+            now = time.monotonic()
+            stale = []
+            for name, proc in live:
+                last, _ = self._proc_sample_cache.get(proc.pid, (0.0, None))
+                if now - last > self.PROCESS_SAMPLE_INTERVAL + random.random() * 0.1:
+                    stale.append(proc)
+            fresh = await asyncio.gather(
+                *(asyncio.to_thread(self._sample_process, proc) for proc in stale)
+            )
+            for proc, sample in zip(stale, fresh):
+                self._proc_sample_cache[proc.pid] = (now, sample)
+            samples = [self._proc_sample_cache[proc.pid][1] for _, proc in live]
+
+            for (name, proc), sample in zip(live, samples):
+                if sample is None:
+                    health_info['server_processes'][name] = {'status': 'process_not_found'}
+                else:
+                    health_info['server_processes'][name] = {
+                        'pid': proc.pid,
+                        'cpu_percent': sample['cpu_percent'],
+                        'memory_percent': sample['memory_percent'],
+                        'status': 'running'
+                    }
+
             return health_info
 
         except Exception as e:
@@ -497,7 +899,8 @@ class MCPServerManager:
 
 # MCP Server Implementation
 app = FastMCP("mcp-server-manager")
-fastapi_app = FastAPI(title="MCP Server Management System")
+fastapi_app = FastAPI(title="MCP Server Management System",
+                      default_response_class=ORJSONResponse)
 
 # Add CORS middleware
 fastapi_app.add_middleware(
@@ -509,6 +912,8 @@ fastapi_app.add_middleware(
 )
 
 manager = MCPServerManager()
+fastapi_app.add_event_handler("startup", manager.startup)
+fastapi_app.add_event_handler("shutdown", manager.shutdown)
 
 @app.tool()
 async def start_mcp_server(server_name: str) -> Dict[str, Any]:
@@ -599,6 +1004,16 @@ async def list_servers():
     """List all configured MCP servers."""
     return manager.config['mcpServers']
 
+@fastapi_app.post("/servers/start_all")
+async def start_all_endpoint():
+    """Start all configured MCP servers via REST API."""
+    return await manager.start_all()
+
+@fastapi_app.post("/servers/stop_all")
+async def stop_all_endpoint():
+    """Stop all running MCP servers via REST API."""
+    return await manager.stop_all()
+
 @fastapi_app.post("/servers/{server_name}/start")
 async def start_server_endpoint(server_name: str):
     """Start a specific MCP server via REST API."""
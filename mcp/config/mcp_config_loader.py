@@ -12,6 +12,12 @@ import os
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 class MCPConfigLoader:
     """Loads and manages MCP server configurations"""
 
@@ -26,8 +32,9 @@ class MCPConfigLoader:
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+            # handler below covers both parsers
+            return _json_loads(self.config_path.read_bytes())
         except FileNotFoundError:
             print(f"⚠️  Configuration file not found: {self.config_path}")
             return self._get_default_config()
@@ -17,11 +17,26 @@ class MCPValidationError(Exception):
 		self.code = code or "validation_error"
 
 
+_MISSING = object()
+
+
 def require_fields(data: dict[str, Any], required: Iterable[str]) -> None:
-	"""Ensure required keys exist and are non-empty."""
+	"""Ensure required keys exist and are non-empty.
+
+	Pass a tuple or list; other iterables are materialized once. The
+	missing-field list is only built when a check actually fails.
+	"""
+	if not isinstance(required, (tuple, list)):
+		required = tuple(required)
+	get = data.get
+	for k in required:
+		v = get(k, _MISSING)
+		if v is _MISSING or v is None or v == "":
+			break
+	else:
+		return
 	missing = [k for k in required if k not in data or data[k] in (None, "")]
-	if missing:
-		raise MCPValidationError(f"Missing required fields: {', '.join(missing)}", code="missing_fields")
+	raise MCPValidationError(f"Missing required fields: {', '.join(missing)}", code="missing_fields")
 
 
 def bound_length(value: str, *, max_len: int = 10_000) -> str:
@@ -12,21 +12,27 @@ import os
 import sys
 import subprocess
 import platform
+from importlib.util import find_spec
 from pathlib import Path
 
+# Resolved once at import instead of on every server start
+_LAUNCHER_DIR = Path(__file__).resolve().parent
+_REPO_ROOT = _LAUNCHER_DIR.parents[1]
+# Use authoritative servers directory at repo root
+_SERVER_DIR = _REPO_ROOT / 'servers'
+
+REQUIRED_PACKAGES = (
+    'fastapi', 'uvicorn', 'websockets', 'psutil', 'pyperclip', 'plyer'
+)
+
 def check_dependencies():
     """Check if required dependencies are installed"""
-    required_packages = [
-        'fastapi', 'uvicorn', 'websockets', 'psutil', 'pyperclip', 'plyer'
+    # find_spec locates each package without executing its import
+    missing = [
+        package for package in REQUIRED_PACKAGES
+        if find_spec(package.replace('-', '_')) is None
     ]
 
-    missing = []
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing.append(package)
-
     if missing:
         print(f"❌ Missing dependencies: {', '.join(missing)}")
         print("Install with: pip install -r servers/requirements-mcp.txt")
@@ -54,9 +60,7 @@ def start_remote_server(host='localhost', port=None, stdio=False):
     if port is None:
         port = find_free_port()
 
-    # Use authoritative servers directory at repo root
-    root = Path(__file__).resolve().parents[2]
-    server_path = root / 'servers' / 'server.py'
+    server_path = _SERVER_DIR / 'server.py'
 
     if not server_path.exists():
         print(f"❌ Remote server not found: {server_path}")
@@ -74,11 +78,11 @@ def start_remote_server(host='localhost', port=None, stdio=False):
     try:
         if stdio:
             # For STDIO mode, run and wait
-            result = subprocess.run(cmd, cwd=Path(__file__).parent)
+            result = subprocess.run(cmd, cwd=_LAUNCHER_DIR)
             return result.returncode == 0
         else:
             # For server mode, run in background
-            process = subprocess.Popen(cmd, cwd=Path(__file__).parent)
+            process = subprocess.Popen(cmd, cwd=_LAUNCHER_DIR)
             print(f"✅ Remote server started (PID: {process.pid})")
             print(f"🌐 Server URL: http://{host}:{port}")
             print(f"🔧 Health check: http://{host}:{port}/health")
@@ -90,9 +94,7 @@ def start_remote_server(host='localhost', port=None, stdio=False):
 
 def start_desktop_server():
     """Start the desktop MCP server"""
-    # Use authoritative servers directory at repo root
-    root = Path(__file__).resolve().parents[2]
-    server_path = root / 'servers' / 'desktop_server.py'
+    server_path = _SERVER_DIR / 'desktop_server.py'
 
     if not server_path.exists():
         print(f"❌ Desktop server not found: {server_path}")
@@ -103,7 +105,7 @@ def start_desktop_server():
     try:
         # Desktop server runs in STDIO mode
         result = subprocess.run([sys.executable, str(server_path)],
-                              cwd=Path(__file__).parent)
+                              cwd=_LAUNCHER_DIR)
         return result.returncode == 0
 
     except Exception as e:
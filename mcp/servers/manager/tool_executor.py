@@ -9,11 +9,22 @@ import json
 import logging
 import os
 import sys
+import time
 from typing import Any, Dict, Optional
 
 import psutil
 import requests
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,7 +56,7 @@ class MCPToolExecutor:
                 'server': server_name,
                 'tool': tool_name,
                 'result': result,
-                'timestamp': asyncio.get_event_loop().time()
+                'timestamp': time.monotonic()
             }
 
         except Exception as e:
@@ -78,7 +89,6 @@ class MCPToolExecutor:
     async def _execute_via_websocket(self, host: str, port: int, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute tool via WebSocket connection."""
         import websockets
-        import json
 
         uri = f"ws://{host}:{port}/ws/desktop"
 
@@ -87,7 +97,7 @@ class MCPToolExecutor:
                 # Send tool execution request
                 request = {
                     "jsonrpc": "2.0",
-                    "id": f"tool_exec_{int(asyncio.get_event_loop().time())}",
+                    "id": f"tool_exec_{int(time.monotonic())}",
                     "method": "tools/call",
                     "params": {
                         "name": tool_name,
@@ -95,11 +105,11 @@ class MCPToolExecutor:
                     }
                 }
 
-                await websocket.send(json.dumps(request))
+                await websocket.send(_json_dumps(request))
 
                 # Receive response
                 response_text = await websocket.recv()
-                response = json.loads(response_text)
+                response = _json_loads(response_text)
 
                 if 'result' in response:
                     return response['result']
@@ -114,12 +124,11 @@ class MCPToolExecutor:
     async def _execute_via_http(self, host: str, port: int, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute tool via HTTP API."""
         import aiohttp
-        import json
 
         url = f"http://{host}:{port}/tools/call"
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(json_serialize=_json_dumps) as session:
                 request_data = {
                     "name": tool_name,
                     "arguments": parameters
@@ -127,7 +136,7 @@ class MCPToolExecutor:
 
                 async with session.post(url, json=request_data) as response:
                     if response.status == 200:
-                        result = await response.json()
+                        result = await response.json(loads=_json_loads)
                         return result
                     else:
                         error_text = await response.text()
@@ -18,17 +18,20 @@ Usage:
 """
 
 import asyncio
-import json
 import logging
 import os
+import stat
 import sys
-import uuid
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional
 import argparse
+import orjson
 import websockets
 from websockets.exceptions import ConnectionClosedError
 import uvicorn
 from fastapi import FastAPI, WebSocket, HTTPException, Depends
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 import httpx
@@ -48,6 +51,52 @@ logger = logging.getLogger(__name__)
 MCP_VERSION = "2024-11-05"
 JSONRPC_VERSION = "2.0"
 
+# Largest single JSON-RPC line accepted on stdin
+STDIO_LINE_LIMIT = 16 * 1024 * 1024
+STDIO_READ_SIZE = 64 * 1024
+
+# Interned method names; incoming methods are interned too so dispatch
+# lookups hit the identity fast path
+METHOD_INITIALIZE = sys.intern("initialize")
+METHOD_TOOLS_LIST = sys.intern("tools/list")
+METHOD_TOOLS_CALL = sys.intern("tools/call")
+METHOD_RESOURCES_LIST = sys.intern("resources/list")
+METHOD_RESOURCES_READ = sys.intern("resources/read")
+
+# Shared read-only params for requests that omit them
+_EMPTY_PARAMS = MappingProxyType({})
+
+# Methods whose responses can be served from a cached encoding
+_PRE_ENCODED_METHODS = frozenset({METHOD_INITIALIZE, METHOD_TOOLS_LIST, METHOD_RESOURCES_LIST})
+
+# Server capabilities are static; share one dict across initialize calls
+_CAPABILITIES = {
+    "tools": {
+        "list": True,
+        "call": True
+    },
+    "resources": {
+        "list": True,
+        "read": True
+    },
+    "prompts": {
+        "list": True,
+        "get": True
+    }
+}
+
+# Liveness probes hit /health constantly; its body never changes
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "server": "LLM Remote MCP Server"})
+
+_INITIALIZE_RESULT = {
+    "protocolVersion": MCP_VERSION,
+    "capabilities": _CAPABILITIES,
+    "serverInfo": {
+        "name": "LLM Remote MCP Server",
+        "version": "1.0.0"
+    }
+}
+
 class MCPMessage(BaseModel):
     jsonrpc: str = JSONRPC_VERSION
     id: Optional[str] = None
@@ -56,16 +105,38 @@ class MCPMessage(BaseModel):
     result: Optional[Any] = None
     error: Optional[Dict[str, Any]] = None
 
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes with orjson"""
+        return orjson.dumps(self.model_dump())
+
+    def to_json_str(self) -> str:
+        """Serialize to a JSON string for text-only transports"""
+        return self.to_json().decode()
+
 class MCPTool:
+    # Subclasses declare an empty __slots__ so instances stay dict-free
+    __slots__ = ("name", "description", "parameters", "_info")
+
     def __init__(self, name: str, description: str, parameters: Dict[str, Any]):
         self.name = name
         self.description = description
         self.parameters = parameters
+        self._info = {
+            "name": name,
+            "description": description,
+            "inputSchema": parameters
+        }
+
+    def get_tool_info(self) -> Dict[str, Any]:
+        """Get the tool's listing entry (built once at construction)"""
+        return self._info
 
     async def execute(self, **kwargs) -> Any:
         raise NotImplementedError("Tool execution not implemented")
 
 class FileSystemTool(MCPTool):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "filesystem_read",
@@ -87,6 +158,8 @@ class FileSystemTool(MCPTool):
             raise Exception(f"Failed to read file {path}: {str(e)}")
 
 class WebSearchTool(MCPTool):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "web_search",
@@ -112,6 +185,8 @@ class WebSearchTool(MCPTool):
         ]
 
 class DatabaseTool(MCPTool):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             "database_query",
@@ -135,63 +210,82 @@ class MCPServer:
         self.tools: Dict[str, MCPTool] = {}
         self.resources: Dict[str, Dict[str, Any]] = {}
         self.sessions: Dict[str, Dict[str, Any]] = {}
+        self._tools_list_cache: Optional[List[Dict[str, Any]]] = None
+        self._resources_list_cache: Optional[List[Dict[str, Any]]] = None
+        # orjson-encoded results for methods whose result only changes on registration
+        self._encoded_results: Dict[str, bytes] = {}
+        self._dispatch = {
+            METHOD_INITIALIZE: self.handle_initialize,
+            METHOD_TOOLS_LIST: lambda params: self.handle_tools_list(),
+            METHOD_TOOLS_CALL: self.handle_tools_call,
+            METHOD_RESOURCES_LIST: lambda params: self.handle_resources_list(),
+            METHOD_RESOURCES_READ: self.handle_resources_read
+        }
         self._register_tools()
 
+    def register_method(self, method: str, handler):
+        """Register a handler coroutine function taking the request params"""
+        method = sys.intern(method)
+        self._dispatch[method] = handler
+        self._encoded_results.pop(method, None)
+
     def _register_tools(self):
         """Register available tools"""
-        self.tools["filesystem_read"] = FileSystemTool()
-        self.tools["web_search"] = WebSearchTool()
-        self.tools["database_query"] = DatabaseTool()
+        self.register_tools([FileSystemTool(), WebSearchTool(), DatabaseTool()])
+
+    def register_tool(self, tool: MCPTool):
+        """Register a tool and invalidate the cached tools list"""
+        tool.name = sys.intern(tool.name)
+        self.tools[tool.name] = tool
+        self._tools_list_cache = None
+        self._encoded_results.pop(METHOD_TOOLS_LIST, None)
+
+    def register_tools(self, tools: Iterable[MCPTool]):
+        """Register several tools in one pass"""
+        for tool in tools:
+            tool.name = sys.intern(tool.name)
+            self.tools[tool.name] = tool
+        self._tools_list_cache = None
+        self._encoded_results.pop(METHOD_TOOLS_LIST, None)
+
+    def register_resources(self, resources: Dict[str, Dict[str, Any]]):
+        """Register several resources in one pass"""
+        self.resources.update(resources)
+        self._resources_list_cache = None
+        self._encoded_results.pop(METHOD_RESOURCES_LIST, None)
+
+    def register_resource(self, uri: str, resource: Dict[str, Any]):
+        """Register a resource and invalidate the cached resources list"""
+        self.resources[uri] = resource
+        self._resources_list_cache = None
+        self._encoded_results.pop(METHOD_RESOURCES_LIST, None)
 
     def get_capabilities(self) -> Dict[str, Any]:
         """Get server capabilities"""
-        return {
-            "tools": {
-                "list": True,
-                "call": True
-            },
-            "resources": {
-                "list": True,
-                "read": True
-            },
-            "prompts": {
-                "list": True,
-                "get": True
-            }
-        }
+        return _CAPABILITIES
 
     async def handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle initialization request"""
-        session_id = str(uuid.uuid4())
+        session_id = os.urandom(16).hex()
         self.sessions[session_id] = {
             "client_info": params.get("clientInfo", {}),
             "capabilities": params.get("capabilities", {})
         }
 
-        return {
-            "protocolVersion": MCP_VERSION,
-            "capabilities": self.get_capabilities(),
-            "serverInfo": {
-                "name": "LLM Remote MCP Server",
-                "version": "1.0.0"
-            }
-        }
+        return _INITIALIZE_RESULT
 
     async def handle_tools_list(self) -> List[Dict[str, Any]]:
         """Handle tools list request"""
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.parameters
-            }
-            for tool in self.tools.values()
-        ]
+        if self._tools_list_cache is None:
+            self._tools_list_cache = [tool.get_tool_info() for tool in self.tools.values()]
+        return self._tools_list_cache
 
     async def handle_tools_call(self, params: Dict[str, Any]) -> Any:
         """Handle tool call request"""
         tool_name = params.get("name")
         tool_args = params.get("arguments", {})
+        if isinstance(tool_name, str):
+            tool_name = sys.intern(tool_name)
 
         if tool_name not in self.tools:
             raise Exception(f"Tool '{tool_name}' not found")
@@ -201,15 +295,17 @@ class MCPServer:
 
     async def handle_resources_list(self) -> List[Dict[str, Any]]:
         """Handle resources list request"""
-        return [
-            {
-                "uri": uri,
-                "name": resource.get("name", uri),
-                "description": resource.get("description", ""),
-                "mimeType": resource.get("mimeType", "text/plain")
-            }
-            for uri, resource in self.resources.items()
-        ]
+        if self._resources_list_cache is None:
+            self._resources_list_cache = [
+                {
+                    "uri": uri,
+                    "name": resource.get("name", uri),
+                    "description": resource.get("description", ""),
+                    "mimeType": resource.get("mimeType", "text/plain")
+                }
+                for uri, resource in self.resources.items()
+            ]
+        return self._resources_list_cache
 
     async def handle_resources_read(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle resource read request"""
@@ -231,20 +327,14 @@ class MCPServer:
     async def process_message(self, message: MCPMessage) -> MCPMessage:
         """Process an incoming MCP message"""
         try:
-            if message.method == "initialize":
-                result = await self.handle_initialize(message.params or {})
-            elif message.method == "tools/list":
-                result = await self.handle_tools_list()
-            elif message.method == "tools/call":
-                result = await self.handle_tools_call(message.params or {})
-            elif message.method == "resources/list":
-                result = await self.handle_resources_list()
-            elif message.method == "resources/read":
-                result = await self.handle_resources_read(message.params or {})
-            else:
-                raise Exception(f"Unknown method: {message.method}")
-
-            return MCPMessage(
+            method = message.method
+            handler = self._dispatch.get(sys.intern(method) if method else method)
+            if handler is None:
+                raise Exception(f"Unknown method: {method}")
+            result = await handler(message.params if message.params is not None else _EMPTY_PARAMS)
+
+            # Responses are built from already-validated fields; skip re-validation
+            return MCPMessage.model_construct(
                 jsonrpc=JSONRPC_VERSION,
                 id=message.id,
                 result=result
@@ -252,7 +342,7 @@ class MCPServer:
 
         except Exception as e:
             logger.error(f"Error processing message: {e}")
-            return MCPMessage(
+            return MCPMessage.model_construct(
                 jsonrpc=JSONRPC_VERSION,
                 id=message.id,
                 error={
@@ -261,17 +351,76 @@ class MCPServer:
                 }
             )
 
+    async def process_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Process a decoded JSON-RPC request without building MCPMessage objects"""
+        msg_id = data.get("id")
+        method = data.get("method")
+        if isinstance(method, str):
+            method = sys.intern(method)
+        try:
+            handler = self._dispatch.get(method)
+            if handler is None:
+                raise Exception(f"Unknown method: {method}")
+            params = data.get("params")
+            result = await handler(params if params is not None else _EMPTY_PARAMS)
+            return {"jsonrpc": JSONRPC_VERSION, "id": msg_id, "result": result}
+
+        except Exception as e:
+            logger.error(f"Error processing message: {e}")
+            return {
+                "jsonrpc": JSONRPC_VERSION,
+                "id": msg_id,
+                "error": {
+                    "code": -32000,
+                    "message": str(e)
+                }
+            }
+
+    async def process_encoded(self, data: Dict[str, Any]) -> bytes:
+        """Process a decoded request and return the encoded JSON-RPC response
+
+        initialize, tools/list and resources/list splice a cached encoding of
+        their result into the envelope instead of re-encoding it per call.
+        """
+        method = data.get("method")
+        if isinstance(method, str):
+            method = sys.intern(method)
+        if method in _PRE_ENCODED_METHODS:
+            try:
+                encoded = self._encoded_results.get(method)
+                if encoded is None or method is METHOD_INITIALIZE:
+                    # initialize still runs for its session bookkeeping
+                    params = data.get("params")
+                    result = await self._dispatch[method](params if params is not None else _EMPTY_PARAMS)
+                    if encoded is None:
+                        encoded = self._encoded_results[method] = orjson.dumps(result)
+                return (b'{"jsonrpc":"2.0","id":' + orjson.dumps(data.get("id"))
+                        + b',"result":' + encoded + b'}')
+            except Exception:
+                pass  # fall through to the general path for error reporting
+        return orjson.dumps(await self.process_dict(data))
+
+def _enable_eager_tasks():
+    """Run new tasks eagerly until their first suspension (Python 3.12+)"""
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
 # Global server instance
 mcp_server = MCPServer()
 
 # FastAPI app for HTTP endpoints
-app = FastAPI(title="LLM Remote MCP Server", version="1.0.0")
+app = FastAPI(title="LLM Remote MCP Server", version="1.0.0",
+              default_response_class=ORJSONResponse)
 security = HTTPBearer()
 
+# Most handlers finish without awaiting; skip a loop iteration per task
+app.add_event_handler("startup", _enable_eager_tasks)
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "server": "LLM Remote MCP Server"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 @app.websocket("/mcp")
 async def mcp_websocket(websocket: WebSocket):
@@ -282,49 +431,130 @@ async def mcp_websocket(websocket: WebSocket):
         while True:
             # Receive message
             data = await websocket.receive_text()
-            message_data = json.loads(data)
-            message = MCPMessage(**message_data)
+            message_data = orjson.loads(data)
 
             # Process message
-            response = await mcp_server.process_message(message)
+            response = await mcp_server.process_encoded(message_data)
 
             # Send response
-            await websocket.send_text(response.json())
+            await websocket.send_text(response.decode())
 
     except ConnectionClosedError:
         logger.info("WebSocket connection closed")
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
 
+def _owns_pipe(fd: int) -> bool:
+    """Whether fd is a pipe or socket that stderr does not also write through"""
+    try:
+        st = os.fstat(fd)
+        if not (stat.S_ISFIFO(st.st_mode) or stat.S_ISSOCK(st.st_mode)):
+            return False
+        try:
+            return not os.path.samestat(st, os.fstat(sys.stderr.fileno()))
+        except (OSError, ValueError):
+            return True  # stderr closed or not a real file
+    except (OSError, ValueError):
+        return False
+
+async def _open_stdio():
+    """Attach asyncio streams to stdin/stdout where that is safe
+
+    The pipe transports put the fd's open file description into O_NONBLOCK.
+    A TTY, or a pipe that stderr shares through 2>&1, would then make blocking
+    log writes fail with EAGAIN, and regular files cannot be registered at all.
+    In those cases None is returned and the blocking fallbacks are used.
+    """
+    loop = asyncio.get_running_loop()
+    reader = writer = None
+
+    if _owns_pipe(sys.stdin.fileno()):
+        reader = asyncio.StreamReader(limit=STDIO_LINE_LIMIT)
+        protocol = asyncio.StreamReaderProtocol(reader)
+        await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+
+    if _owns_pipe(sys.stdout.fileno()):
+        transport, write_protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, sys.stdout
+        )
+        writer = asyncio.StreamWriter(transport, write_protocol, reader, loop)
+    return reader, writer
+
+async def _read_stdin(reader: Optional[asyncio.StreamReader]) -> bytes:
+    """Read the next available chunk of stdin; b"" at end of input"""
+    if reader is None:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, sys.stdin.buffer.read1, STDIO_READ_SIZE
+        )
+    return await reader.read(STDIO_READ_SIZE)
+
+async def _write_stdout(writer: Optional[asyncio.StreamWriter], data: bytes):
+    """Write a frame to stdout, honoring pipe back-pressure when available"""
+    if writer is None:
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+    else:
+        writer.write(data)
+        await writer.drain()
+
+async def _handle_stdio_line(line: bytes) -> Optional[bytes]:
+    """Process one STDIO frame and return the encoded response, if any"""
+    try:
+        message_data = orjson.loads(line)
+        message = MCPMessage(**message_data)
+
+        # Process message
+        response = await mcp_server.process_message(message)
+        return response.to_json()
+
+    except orjson.JSONDecodeError as e:
+        logger.error(f"Invalid JSON received: {e}")
+    except Exception as e:
+        logger.error(f"Error processing STDIO message: {e}")
+    return None
+
+async def _dispatch_stdio_batch(writer: Optional[asyncio.StreamWriter], lines: List[bytes]):
+    """Dispatch a batch of frames together and write their responses with one flush"""
+    responses = await asyncio.gather(*(_handle_stdio_line(line) for line in lines))
+    frames = [response for response in responses if response is not None]
+    if frames:
+        await _write_stdout(writer, b"\n".join(frames) + b"\n")
+
 async def handle_stdio():
     """Handle STDIO communication for local MCP clients"""
     logger.info("Starting MCP server in STDIO mode")
+    _enable_eager_tasks()
+    reader, writer = await _open_stdio()
+    pending = b""
+    discarding = False
 
     try:
         while True:
-            # Read from stdin
-            line = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
-            if not line:
+            # Read whatever is available; pipelined clients may have sent several frames
+            chunk = await _read_stdin(reader)
+            if not chunk:
+                # The last frame may end without a newline
+                if pending.strip():
+                    await _dispatch_stdio_batch(writer, [pending])
                 break
 
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                message_data = json.loads(line)
-                message = MCPMessage(**message_data)
-
-                # Process message
-                response = await mcp_server.process_message(message)
+            if discarding:
+                # Skip the rest of an oversized frame up to its newline
+                end = chunk.find(b"\n")
+                if end == -1:
+                    continue
+                chunk = chunk[end + 1:]
+                discarding = False
 
-                # Write to stdout
-                print(response.json(), flush=True)
+            *lines, pending = (pending + chunk).split(b"\n")
+            if len(pending) > STDIO_LINE_LIMIT:
+                logger.error("STDIO frame exceeds size limit, discarding")
+                pending = b""
+                discarding = True
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON received: {e}")
-            except Exception as e:
-                logger.error(f"Error processing STDIO message: {e}")
+            lines = [line for line in lines if line.strip()]
+            if lines:
+                await _dispatch_stdio_batch(writer, lines)
 
     except KeyboardInterrupt:
         logger.info("STDIO server stopped")
@@ -334,6 +564,7 @@ def main():
     parser.add_argument("--host", default="api.digitalhustlelab.com", help="Host to bind to")
     parser.add_argument("--port", type=int, default=3001, help="Port to bind to")
     parser.add_argument("--stdio", action="store_true", help="Run in STDIO mode for local clients")
+    parser.add_argument("--workers", type=int, default=1, help="Number of HTTP worker processes")
     parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
 
     args = parser.parse_args()
@@ -347,11 +578,15 @@ def main():
         asyncio.run(handle_stdio())
     else:
         # Run HTTP/WebSocket server
-        logger.info(f"Starting HTTP/WebSocket server on {args.host}:{args.port}")
+        logger.info("Starting HTTP/WebSocket server on %s:%s", args.host, args.port)
+        # Worker processes must import the app themselves, so pass it by name;
+        # each worker holds its own MCPServer state
         uvicorn.run(
-            app,
+            f"{Path(__file__).stem}:app" if args.workers > 1 else app,
+            app_dir=str(Path(__file__).parent),
             host=args.host,
             port=args.port,
+            workers=args.workers,
             log_level=args.log_level.lower()
         )
 
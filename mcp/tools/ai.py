@@ -9,12 +9,45 @@ Provides content generation, analysis, and AI utilities.
 
 import re
 import json
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 
 from ..core import MCPValidationError
 
 
+_VOWEL_RUN_RE = re.compile(r'[aeiouy]+')
+_WORD_RE = re.compile(r'\b\w+\b')
+# A run of text between terminators that holds at least one non-space char
+_SENTENCE_RE = re.compile(r'[^.!?]*[^\s.!?][^.!?]*')
+_NON_WORD_RE = re.compile(r'[^\w]')
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+_BLANK_LINE_RE = re.compile(r'^[^\S\n]+$', re.MULTILINE)
+_NUMBERED_ITEM_RE = re.compile(r'\d+\.\s*')
+
+# Flesch Reading Ease lower bounds and the grade for each band, lowest first
+_READING_LEVEL_THRESHOLDS = (30, 50, 60, 70, 80, 90)
+_READING_LEVELS = (
+    "College Graduate", "College", "10th-12th grade", "8th-9th grade",
+    "7th grade", "6th grade", "5th grade"
+)
+
+
+@lru_cache(maxsize=100_000)
+def _count_syllables_cached(word: str) -> int:
+    """Count syllables in a lowercased word; memoized since words repeat heavily in text."""
+    # Each maximal run of vowels starts one syllable; the regex engine walks
+    # the characters in C instead of a Python-level index loop
+    count = len(_VOWEL_RUN_RE.findall(word))
+    if word.endswith("e"):
+        count -= 1
+    return count if count > 0 else 1
+
+
 class MCPAITools:
     """Basic AI tools for MCP servers."""
 
@@ -23,27 +56,25 @@ class MCPAITools:
         """Perform basic text analysis."""
         try:
             words = text.split()
-            sentences = re.split(r'[.!?]+', text)
+            # Segment count of re.split(r'[.!?]+'), without building the segments
+            sentence_count = len(_SENTENCE_END_RE.findall(text)) + 1
 
             # Word frequency analysis
-            word_freq = {}
-            for word in words:
-                clean_word = re.sub(r'[^\w]', '', word.lower())
-                if clean_word:
-                    word_freq[clean_word] = word_freq.get(clean_word, 0) + 1
+            word_freq = Counter(filter(None, (_NON_WORD_RE.sub('', word.lower()) for word in words)))
 
             # Basic readability metrics
-            avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
-            avg_sentence_length = len(words) / len(sentences) if sentences else 0
+            avg_word_length = sum(map(len, words)) / len(words) if words else 0
+            avg_sentence_length = len(words) / sentence_count
 
             return {
                 "word_count": len(words),
-                "sentence_count": len(sentences),
+                "sentence_count": sentence_count,
                 "character_count": len(text),
-                "character_count_no_spaces": len(text.replace(" ", "")),
+                "character_count_no_spaces": len(text) - text.count(" "),
                 "average_word_length": round(avg_word_length, 2),
                 "average_sentence_length": round(avg_sentence_length, 2),
-                "most_common_words": sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:10],
+                # Top-k selection instead of sorting the whole vocabulary
+                "most_common_words": nlargest(10, word_freq.items(), key=itemgetter(1)),
                 "unique_words": len(word_freq),
                 "lexical_density": len(word_freq) / len(words) if words else 0
             }
@@ -69,9 +100,7 @@ class MCPAITools:
             filtered_words = [word for word in words if word not in stop_words and len(word) > 2]
 
             # Calculate word frequencies
-            word_freq = {}
-            for word in filtered_words:
-                word_freq[word] = word_freq.get(word, 0) + 1
+            word_freq = Counter(filtered_words)
 
             # Calculate TF-IDF-like scores (simplified)
             keywords = []
@@ -89,9 +118,8 @@ class MCPAITools:
                     "score": round(score, 4)
                 })
 
-            # Sort by score and return top keywords
-            keywords.sort(key=lambda x: x["score"], reverse=True)
-            return keywords[:max_keywords]
+            # Return top keywords by score
+            return nlargest(max_keywords, keywords, key=itemgetter("score"))
         except Exception as e:
             raise MCPValidationError(f"Failed to extract keywords: {str(e)}")
 
@@ -120,8 +148,8 @@ class MCPAITools:
                 sentence_scores.append((i, score))
 
             # Select top sentences
-            sentence_scores.sort(key=lambda x: x[1], reverse=True)
-            selected_indices = sorted([idx for idx, _ in sentence_scores[:max_sentences]])
+            top_scores = nlargest(max_sentences, sentence_scores, key=itemgetter(1))
+            selected_indices = sorted([idx for idx, _ in top_scores])
 
             summary_sentences = [sentences[i] for i in selected_indices]
             summary = '. '.join(summary_sentences)
@@ -214,56 +242,45 @@ class MCPContentTools:
     def format_content(text: str, format_type: str = "markdown") -> str:
         """Format text content in different formats."""
         try:
-            if format_type == "markdown":
-                # Basic markdown formatting
-                lines = text.split('\n')
-                formatted_lines = []
-
-                for line in lines:
-                    # Convert headers
-                    if line.startswith('#'):
-                        formatted_lines.append(line)
-                    elif len(line.strip()) == 0:
-                        formatted_lines.append('')
-                    elif line.startswith('- ') or line.startswith('* '):
-                        formatted_lines.append(line)
-                    elif re.match(r'^\d+\.', line):
-                        formatted_lines.append(line)
-                    else:
-                        # Regular paragraph
-                        formatted_lines.append(line)
-
-                return '\n'.join(formatted_lines)
-
-            elif format_type == "html":
-                # Basic HTML formatting
-                lines = text.split('\n')
-                formatted_lines = []
-
-                for line in lines:
-                    if line.startswith('#'):
-                        level = len(line) - len(line.lstrip('#'))
-                        content = line.lstrip('#').strip()
-                        formatted_lines.append(f'<h{level}>{content}</h{level}>')
-                    elif len(line.strip()) == 0:
-                        formatted_lines.append('<br>')
-                    elif line.startswith('- ') or line.startswith('* '):
-                        content = line[2:].strip()
-                        formatted_lines.append(f'<li>{content}</li>')
-                    elif re.match(r'^\d+\.', line):
-                        content = re.sub(r'^\d+\.\s*', '', line)
-                        formatted_lines.append(f'<li>{content}</li>')
-                    else:
-                        formatted_lines.append(f'<p>{line}</p>')
-
-                return '\n'.join(formatted_lines)
-
-            else:
-                return text
+            formatter = _CONTENT_FORMATTERS.get(format_type)
+            return formatter(text) if formatter is not None else text
         except Exception as e:
             raise MCPValidationError(f"Failed to format content: {str(e)}")
 
 
+def _format_markdown(text: str) -> str:
+    """Basic markdown formatting: lines pass through, whitespace-only lines are emptied."""
+    return _BLANK_LINE_RE.sub('', text)
+
+
+def _format_html(text: str) -> str:
+    """Basic HTML formatting, one tag per line."""
+    formatted_lines = []
+    append = formatted_lines.append
+
+    for line in text.split('\n'):
+        if line.startswith('#'):
+            level = len(line) - len(line.lstrip('#'))
+            content = line.lstrip('#').strip()
+            append(f'<h{level}>{content}</h{level}>')
+        elif not line.strip():
+            append('<br>')
+        elif line.startswith(('- ', '* ')):
+            append(f'<li>{line[2:].strip()}</li>')
+        elif (match := _NUMBERED_ITEM_RE.match(line)) is not None:
+            append(f'<li>{line[match.end():]}</li>')
+        else:
+            append(f'<p>{line}</p>')
+
+    return '\n'.join(formatted_lines)
+
+
+_CONTENT_FORMATTERS = {
+    "markdown": _format_markdown,
+    "html": _format_html,
+}
+
+
 class MCPAnalysisTools:
     """Advanced analysis tools for MCP servers."""
 
@@ -284,6 +301,7 @@ class MCPAnalysisTools:
 
                 sia = SentimentIntensityAnalyzer()
                 scores = sia.polarity_scores(text)
+                total_words = len(text.split())
 
                 # Convert NLTK scores to our format
                 compound = scores['compound']
@@ -300,9 +318,9 @@ class MCPAnalysisTools:
                 return {
                     "sentiment": sentiment,
                     "confidence": round(confidence, 3),
-                    "positive_words": int(scores['pos'] * len(text.split())),
-                    "negative_words": int(scores['neg'] * len(text.split())),
-                    "total_words": len(text.split()),
+                    "positive_words": int(scores['pos'] * total_words),
+                    "negative_words": int(scores['neg'] * total_words),
+                    "total_words": total_words,
                     "positive_score": round(scores['pos'], 3),
                     "negative_score": round(scores['neg'], 3),
                     "library": "nltk"
@@ -400,17 +418,17 @@ class MCPAnalysisTools:
     def readability_analysis(text: str) -> Dict[str, Any]:
         """Calculate readability metrics for text."""
         try:
-            sentences = re.split(r'[.!?]+', text)
-            sentences = [s.strip() for s in sentences if s.strip()]
-
-            words = []
-            for sentence in sentences:
-                sentence_words = re.findall(r'\b\w+\b', sentence)
-                words.extend(sentence_words)
+            # Words never span sentence terminators, so one scan of the whole
+            # text yields the same tokens as scanning each sentence
+            words = _WORD_RE.findall(text)
 
-            total_sentences = len(sentences)
+            total_sentences = sum(1 for _ in _SENTENCE_RE.finditer(text))
             total_words = len(words)
-            total_syllables = sum(MCPAnalysisTools._count_syllables(word) for word in words)
+            # Count each distinct word once and weight by its frequency
+            total_syllables = sum(
+                MCPAnalysisTools._count_syllables(word) * freq
+                for word, freq in Counter(words).items()
+            )
 
             if total_sentences == 0 or total_words == 0:
                 return {"error": "No readable content found"}
@@ -422,20 +440,7 @@ class MCPAnalysisTools:
             fk_grade = 0.39 * (total_words / total_sentences) + 11.8 * (total_syllables / total_words) - 15.59
 
             # Determine reading level
-            if flesch_score >= 90:
-                level = "5th grade"
-            elif flesch_score >= 80:
-                level = "6th grade"
-            elif flesch_score >= 70:
-                level = "7th grade"
-            elif flesch_score >= 60:
-                level = "8th-9th grade"
-            elif flesch_score >= 50:
-                level = "10th-12th grade"
-            elif flesch_score >= 30:
-                level = "College"
-            else:
-                level = "College Graduate"
+            level = _READING_LEVELS[bisect_right(_READING_LEVEL_THRESHOLDS, flesch_score)]
 
             return {
                 "flesch_reading_ease": round(flesch_score, 2),
@@ -453,24 +458,7 @@ class MCPAnalysisTools:
     @staticmethod
     def _count_syllables(word: str) -> int:
         """Count syllables in a word (basic implementation)."""
-        word = word.lower()
-        count = 0
-        vowels = "aeiouy"
-
-        if word[0] in vowels:
-            count += 1
-
-        for i in range(1, len(word)):
-            if word[i] in vowels and word[i - 1] not in vowels:
-                count += 1
-
-        if word.endswith("e"):
-            count -= 1
-
-        if count == 0:
-            count += 1
-
-        return count
+        return _count_syllables_cached(word.lower())
 
     @staticmethod
     def topic_modeling(text: str, num_topics: int = 3) -> Dict[str, Any]:
@@ -7,49 +7,55 @@ Utility functions and helpers for MCP servers.
 Provides common utilities used across MCP components.
 """
 
-from .common import (
-    MCPLogger,
-    MCPConfig,
-    MCPTimer,
-    MCPRateLimiter,
-    MCPRetry,
-    MCPAsyncUtils,
-    MCPFileUtils,
-    MCPStringUtils,
-    MCPDateUtils,
-    MCPMathUtils
-)
-
-from .validation import (
-    MCPParameterValidator,
-    MCPTypeValidator,
-    MCPFormatValidator,
-    MCPBusinessRuleValidator,
-    MCPDataValidator,
-    MCPInputSanitizer,
-    MCPOutputFormatter
-)
-
-from .network import (
-    MCPNetworkClient,
-    MCPWebSocketClient,
-    MCPHTTPClient,
-    MCPProxyManager,
-    MCPConnectionPool,
-    MCPDNSResolver,
-    MCPPortScanner,
-    MCPBandwidthMonitor
-)
-
-from .crypto import (
-    MCPCryptoUtils,
-    MCPHashUtils,
-    MCPJWTUtils,
-    MCPCertificateUtils,
-    MCPAccessControl,
-    MCPPermission,
-    MCPRole
-)
+import importlib
+
+# Exported name -> (submodule, attribute). Submodules are imported on first
+# attribute access so that importing one helper (e.g. mcp.utils.network)
+# does not pull in every crypto and network dependency.
+_LAZY_EXPORTS = {
+    # Common
+    "MCPLogger": (".common.logger", "MCPLogger"),
+    "MCPConfig": (".common", "MCPConfig"),
+    "MCPTimer": (".common", "MCPTimer"),
+    "MCPRateLimiter": (".common", "MCPRateLimiter"),
+    "MCPRetry": (".common", "MCPRetry"),
+    "MCPAsyncUtils": (".common", "MCPAsyncUtils"),
+    "MCPFileUtils": (".common", "MCPFileUtils"),
+    "MCPStringUtils": (".common", "MCPStringUtils"),
+    "MCPDateUtils": (".common", "MCPDateUtils"),
+    "MCPMathUtils": (".common", "MCPMathUtils"),
+
+    # Validation
+    "MCPParameterValidator": (".validation", "MCPParameterValidator"),
+    "MCPTypeValidator": (".validation", "MCPTypeValidator"),
+    "MCPFormatValidator": (".validation", "MCPFormatValidator"),
+    "MCPBusinessRuleValidator": (".validation", "MCPBusinessRuleValidator"),
+    "MCPDataValidator": (".validation", "MCPDataValidator"),
+    "MCPInputSanitizer": (".validation", "MCPInputSanitizer"),
+    "MCPOutputFormatter": (".validation", "MCPOutputFormatter"),
+
+    # Network
+    "MCPNetworkClient": (".network", "MCPNetworkClient"),
+    "MCPWebSocketClient": (".network", "MCPWebSocketClient"),
+    "MCPHTTPClient": (".network", "MCPHTTPClient"),
+    "MCPProxyManager": (".network", "MCPProxyManager"),
+    "MCPConnectionPool": (".network", "MCPConnectionPool"),
+    "MCPDNSResolver": (".network", "MCPDNSResolver"),
+    "MCPPortScanner": (".network", "MCPPortScanner"),
+    "MCPBandwidthMonitor": (".network", "MCPBandwidthMonitor"),
+
+    # Crypto
+    "MCPCryptoUtils": (".crypto.crypto_utils", "MCPCryptoUtils"),
+    "MCPHashUtils": (".crypto.hash_utils", "MCPHashUtils"),
+    "MCPJWTUtils": (".crypto.jwt_utils", "MCPJWTUtils"),
+    "MCPCertificateUtils": (".crypto.cert_utils", "MCPCertificateUtils"),
+    "MCPAccessControl": (".crypto.access_control", "MCPAccessControl"),
+    "MCPPermission": (".crypto.models", "MCPPermission"),
+    "MCPRole": (".crypto.models", "MCPRole"),
+
+    # Legacy alias
+    "MCPJWTManager": (".crypto.jwt_utils", "MCPJWTUtils"),
+}
 
 # from .security import (
 #     MCPJWTUtils,
@@ -59,8 +65,21 @@ from .crypto import (
 #     MCPAuditLogger
 # )
 
-# Legacy alias
-MCPJWTManager = MCPJWTUtils
+
+def __getattr__(name):
+    """Import the submodule behind an exported name on first access (PEP 562)"""
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
 __all__ = [
     # Common
@@ -3,15 +3,35 @@
 
 from __future__ import annotations
 
+import json
+
 import httpx
 from typing import Any, Dict, Optional
 
+try:
+	import orjson
+	ORJSON_AVAILABLE = True
+except ImportError:
+	ORJSON_AVAILABLE = False
+
 from ..core.utils.validation import MCPValidationError, ensure_max_bytes
 
 
 DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
 MAX_BYTES = 2_000_000  # 2MB
 
+if ORJSON_AVAILABLE:
+	_loads = orjson.loads
+
+	def _dumps_bytes(data: Any) -> bytes:
+		# Non-str keys are stringified, as json.dumps does
+		return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+else:
+	_loads = json.loads
+
+	def _dumps_bytes(data: Any) -> bytes:
+		return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
 
 async def get_json(url: str, *, headers: Optional[Dict[str, str]] = None, timeout: httpx.Timeout = DEFAULT_TIMEOUT) -> Any:
 	async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
@@ -22,7 +42,7 @@ async def get_json(url: str, *, headers: Optional[Dict[str, str]] = None, timeou
 			resp.raise_for_status()
 		except httpx.HTTPError as e:
 			raise MCPValidationError(f"HTTP GET failed: {e}", code="http_error")
-		return resp.json()
+		return _loads(content)
 
 
 async def post_json(url: str, data: Any, *, headers: Optional[Dict[str, str]] = None, timeout: httpx.Timeout = DEFAULT_TIMEOUT) -> Any:
@@ -30,12 +50,12 @@ async def post_json(url: str, data: Any, *, headers: Optional[Dict[str, str]] =
 	if headers:
 		h.update(headers)
 	async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-		resp = await client.post(url, json=data, headers=h)
+		resp = await client.post(url, content=_dumps_bytes(data), headers=h)
 		content = resp.content
 		ensure_max_bytes(content, max_bytes=MAX_BYTES)
 		try:
 			resp.raise_for_status()
 		except httpx.HTTPError as e:
 			raise MCPValidationError(f"HTTP POST failed: {e}", code="http_error")
-		return resp.json()
+		return _loads(content)
 
@@ -9,6 +9,9 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+# Common spellings are listed so they match without lowercasing
+_TRUE_VALUES = frozenset({'true', '1', 'yes', 'on', 'True', 'Yes', 'On', 'TRUE', 'YES', 'ON'})
+
 
 @dataclass
 class ServerConfig:
@@ -130,8 +133,12 @@ class EnvironmentConfigLoader:
     
     def _get_bool_env(self, key: str, default: bool = False) -> bool:
         """Get boolean environment variable"""
-        value = os.getenv(key, str(default)).lower()
-        return value in ('true', '1', 'yes', 'on')
+        value = os.getenv(key)
+        if value is None:
+            return default
+        if value in _TRUE_VALUES:
+            return True
+        return value.lower() in _TRUE_VALUES
     
     def validate_configuration(self) -> List[str]:
         """Validate the current configuration and return any errors"""
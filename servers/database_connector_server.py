@@ -19,6 +19,7 @@ Usage:
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -28,6 +29,7 @@ from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
 from datetime import datetime
 import hashlib
+import inspect
 import csv
 import io
 
@@ -79,6 +81,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _json_tool(error_message: str, **dumps_kwargs):
+    """Serialize a tool's result to JSON and report any failure as ValueError"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return json.dumps(await func(*args, **kwargs), indent=2, **dumps_kwargs)
+            except Exception as e:
+                raise ValueError(f"{error_message}: {e}")
+        # Tool schemas read the signature; the wrapper hands back the JSON text
+        wrapper.__signature__ = inspect.signature(func).replace(return_annotation=str)
+        return wrapper
+    return decorator
+
 class DatabaseConnectorServer:
     """Production-grade Database Connector MCP Server"""
 
@@ -119,6 +135,12 @@ class DatabaseConnectorServer:
 
         return True
 
+    def _get_connection_info(self, connection_id: str) -> Dict[str, Any]:
+        """Look up an active connection by ID"""
+        if connection_id not in self.connections:
+            raise ValueError(f"Connection {connection_id} not found")
+        return self.connections[connection_id]
+
     def _get_connection_hash(self, config: Dict[str, Any]) -> str:
         """Generate hash for connection configuration"""
         config_str = json.dumps(config, sort_keys=True)
@@ -130,7 +152,8 @@ class DatabaseConnectorServer:
         @self.server.tool()
         async def connect_database(db_type: str, host: str = None, port: int = None,
                                  database: str = None, username: str = None,
-                                 password: str = None, connection_string: str = None) -> str:
+                                 password: str = None, connection_string: str = None,
+                                 wal: bool = False) -> str:
             """Connect to a database"""
             try:
                 config = {
@@ -140,7 +163,8 @@ class DatabaseConnectorServer:
                     "database": database,
                     "username": username,
                     "password": password,
-                    "connection_string": connection_string
+                    "connection_string": connection_string,
+                    "wal": wal
                 }
 
                 connection_id = self._get_connection_hash(config)
@@ -150,11 +174,12 @@ class DatabaseConnectorServer:
 
                 connection = await self._establish_connection(config)
                 if connection:
+                    now = datetime.now()
                     self.connections[connection_id] = {
                         "connection": connection,
                         "config": config,
-                        "created_at": datetime.now(),
-                        "last_used": datetime.now()
+                        "created_at": now,
+                        "last_used": now
                     }
                     return f"Successfully connected to {db_type} database (ID: {connection_id})"
                 else:
@@ -164,69 +189,48 @@ class DatabaseConnectorServer:
                 raise ValueError(f"Database connection failed: {e}")
 
         @self.server.tool()
-        async def execute_query(connection_id: str, query: str, params: List[Any] = None) -> str:
+        @_json_tool("Query execution failed", default=str)
+        async def execute_query(connection_id: str, query: str, params: List[Any] = None) -> Dict[str, Any]:
             """Execute a database query"""
-            if connection_id not in self.connections:
-                raise ValueError(f"Connection {connection_id} not found")
+            connection_info = self._get_connection_info(connection_id)
 
             if not self._is_query_safe(query):
                 raise ValueError("Query contains blocked commands")
 
-            try:
-                connection_info = self.connections[connection_id]
-                connection = connection_info["connection"]
-                config = connection_info["config"]
-
-                # Update last used timestamp
-                connection_info["last_used"] = datetime.now()
-
-                result = await self._execute_query(connection, query, config["db_type"], params)
+            # Update last used timestamp; the cache entry below shares it
+            now = datetime.now()
+            connection_info["last_used"] = now
 
-                # Cache successful queries
-                query_hash = hashlib.md5(query.encode()).hexdigest()
-                self.query_cache[query_hash] = {
-                    "result": result,
-                    "timestamp": datetime.now()
-                }
+            result = await self._execute_query(
+                connection_info["connection"], query, connection_info["config"]["db_type"], params
+            )
 
-                return json.dumps(result, indent=2, default=str)
+            # Cache successful queries
+            query_hash = hashlib.md5(query.encode()).hexdigest()
+            self.query_cache[query_hash] = {
+                "result": result,
+                "timestamp": now
+            }
 
-            except Exception as e:
-                raise ValueError(f"Query execution failed: {e}")
+            return result
 
         @self.server.tool()
-        async def explore_schema(connection_id: str, table_name: str = None) -> str:
+        @_json_tool("Schema exploration failed")
+        async def explore_schema(connection_id: str, table_name: str = None) -> Dict[str, Any]:
             """Explore database schema"""
-            if connection_id not in self.connections:
-                raise ValueError(f"Connection {connection_id} not found")
-
-            try:
-                connection_info = self.connections[connection_id]
-                connection = connection_info["connection"]
-                config = connection_info["config"]
-
-                schema = await self._explore_schema(connection, config["db_type"], table_name)
-                return json.dumps(schema, indent=2)
-
-            except Exception as e:
-                raise ValueError(f"Schema exploration failed: {e}")
+            connection_info = self._get_connection_info(connection_id)
+            return await self._explore_schema(
+                connection_info["connection"], connection_info["config"]["db_type"], table_name
+            )
 
         @self.server.tool()
-        async def analyze_query_performance(connection_id: str, query: str) -> str:
+        @_json_tool("Query performance analysis failed")
+        async def analyze_query_performance(connection_id: str, query: str) -> Dict[str, Any]:
             """Analyze query performance"""
-            if connection_id not in self.connections:
-                raise ValueError(f"Connection {connection_id} not found")
-
-            try:
-                connection_info = self.connections[connection_id]
-                connection = connection_info["connection"]
-                config = connection_info["config"]
-
-                analysis = await self._analyze_query_performance(connection, query, config["db_type"])
-                return json.dumps(analysis, indent=2)
-
-            except Exception as e:
-                raise ValueError(f"Query performance analysis failed: {e}")
+            connection_info = self._get_connection_info(connection_id)
+            return await self._analyze_query_performance(
+                connection_info["connection"], query, connection_info["config"]["db_type"]
+            )
 
         @self.server.tool()
         async def export_data(connection_id: str, query: str, format: str = "json",
@@ -257,8 +261,12 @@ class DatabaseConnectorServer:
                     if not self._is_path_allowed(file_path):
                         raise ValueError(f"Access denied: {file_path}")
 
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(export_data)
+                    def _write_export():
+                        with open(file_path, 'w', encoding='utf-8') as f:
+                            f.write(export_data)
+
+                    # Keep the event loop free while large exports hit the disk
+                    await asyncio.to_thread(_write_export)
                     return f"Data exported to {file_path}"
                 else:
                     return export_data
@@ -267,21 +275,13 @@ class DatabaseConnectorServer:
                 raise ValueError(f"Data export failed: {e}")
 
         @self.server.tool()
-        async def get_database_stats(connection_id: str) -> str:
+        @_json_tool("Database stats retrieval failed")
+        async def get_database_stats(connection_id: str) -> Dict[str, Any]:
             """Get database statistics"""
-            if connection_id not in self.connections:
-                raise ValueError(f"Connection {connection_id} not found")
-
-            try:
-                connection_info = self.connections[connection_id]
-                connection = connection_info["connection"]
-                config = connection_info["config"]
-
-                stats = await self._get_database_stats(connection, config["db_type"])
-                return json.dumps(stats, indent=2)
-
-            except Exception as e:
-                raise ValueError(f"Database stats retrieval failed: {e}")
+            connection_info = self._get_connection_info(connection_id)
+            return await self._get_database_stats(
+                connection_info["connection"], connection_info["config"]["db_type"]
+            )
 
         @self.server.tool()
         async def disconnect_database(connection_id: str) -> str:
@@ -294,7 +294,7 @@ class DatabaseConnectorServer:
                 connection = connection_info["connection"]
                 config = connection_info["config"]
 
-                await self._close_connection(connection, config["db_type"])
+                await self._close_connection(connection, config["db_type"], config.get("wal", False))
                 del self.connections[connection_id]
 
                 return f"Successfully disconnected from database (ID: {connection_id})"
@@ -378,9 +378,21 @@ class DatabaseConnectorServer:
         """Connect to SQLite database"""
         try:
             db_path = config.get("database", ":memory:")
-            if db_path != ":memory:" and not os.path.isabs(db_path):
+            if db_path == ":memory:":
+                return sqlite3.connect(db_path)
+
+            if not os.path.isabs(db_path):
                 db_path = os.path.abspath(db_path)
-            return sqlite3.connect(db_path)
+            conn = sqlite3.connect(db_path)
+            if config.get("wal"):
+                # Opt-in: WAL persists in the database file, so only switch
+                # when asked; read-only databases keep their journal mode
+                try:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                except sqlite3.OperationalError as e:
+                    logger.warning(f"Could not enable WAL for {db_path}: {e}")
+            return conn
         except Exception as e:
             raise ValueError(f"SQLite connection failed: {e}")
 
@@ -535,9 +547,15 @@ class DatabaseConnectorServer:
                         ORDER BY ordinal_position
                     """, (table_name,))
                 elif db_type.lower() == "mysql":
-                    cursor.execute(f"DESCRIBE {table_name}")
+                    # Same fields as DESCRIBE, with the table name bound as a parameter
+                    cursor.execute("""
+                        SELECT column_name, column_type, is_nullable, column_key, column_default, extra
+                        FROM information_schema.columns
+                        WHERE table_schema = DATABASE() AND table_name = %s
+                        ORDER BY ordinal_position
+                    """, (table_name,))
                 elif db_type.lower() == "sqlite":
-                    cursor.execute(f"PRAGMA table_info({table_name})")
+                    cursor.execute("SELECT * FROM pragma_table_info(?)", (table_name,))
 
                 columns = cursor.fetchall()
                 schema = {
@@ -668,27 +686,26 @@ class DatabaseConnectorServer:
 
             if db_type.lower() == "postgresql":
                 # Get PostgreSQL stats
-                cursor.execute("SELECT version()")
-                stats["version"] = cursor.fetchone()[0]
-
-                cursor.execute("SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = 'public'")
-                stats["table_count"] = cursor.fetchone()[0]
+                cursor.execute("""
+                    SELECT version(),
+                           (SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = 'public')
+                """)
+                stats["version"], stats["table_count"] = cursor.fetchone()
 
             elif db_type.lower() == "mysql":
-                # Get MySQL stats
-                cursor.execute("SELECT VERSION()")
-                stats["version"] = cursor.fetchone()[0]
-
-                cursor.execute("SHOW TABLES")
-                stats["table_count"] = len(cursor.fetchall())
+                # Get MySQL stats; count server-side rather than fetching SHOW TABLES
+                cursor.execute("""
+                    SELECT VERSION(),
+                           (SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = DATABASE())
+                """)
+                stats["version"], stats["table_count"] = cursor.fetchone()
 
             elif db_type.lower() == "sqlite":
                 # Get SQLite stats
-                cursor.execute("SELECT sqlite_version()")
-                stats["version"] = cursor.fetchone()[0]
-
-                cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table'")
-                stats["table_count"] = cursor.fetchone()[0]
+                cursor.execute(
+                    "SELECT sqlite_version(), (SELECT COUNT(*) FROM sqlite_master WHERE type='table')"
+                )
+                stats["version"], stats["table_count"] = cursor.fetchone()
 
             return stats
 
@@ -714,12 +731,18 @@ class DatabaseConnectorServer:
         except Exception as e:
             raise ValueError(f"MongoDB stats retrieval failed: {e}")
 
-    async def _close_connection(self, connection: Any, db_type: str):
+    async def _close_connection(self, connection: Any, db_type: str, optimize: bool = False):
         """Close database connection"""
         try:
             if db_type.lower() == "mongodb":
                 connection.client.close()
             else:
+                if optimize and db_type.lower() == "sqlite":
+                    # Refresh planner statistics gathered over the session
+                    try:
+                        connection.execute("PRAGMA optimize")
+                    except sqlite3.OperationalError as e:
+                        logger.warning(f"PRAGMA optimize skipped: {e}")
                 connection.close()
         except Exception as e:
             logger.warning(f"Error closing {db_type} connection: {e}")
@@ -99,12 +99,15 @@ class MCPDesktopServer:
             if not self._is_path_allowed(path):
                 raise ValueError(f"Access denied: {path}")
 
-            try:
+            def _read() -> str:
                 with open(path, 'r', encoding='utf-8') as f:
                     if offset > 0:
                         f.seek(offset)
-                    content = f.read(length)
-                    return content
+                    return f.read(length)
+
+            try:
+                # Disk I/O runs in a worker thread so other tool calls keep going
+                return await asyncio.to_thread(_read)
             except Exception as e:
                 raise ValueError(f"Failed to read file: {e}")
 
@@ -114,13 +117,12 @@ class MCPDesktopServer:
             if not self._is_path_allowed(path):
                 raise ValueError(f"Access denied: {path}")
 
+            def _write():
+                with open(path, 'a' if mode == "append" else 'w', encoding='utf-8') as f:
+                    f.write(content)
+
             try:
-                if mode == "append":
-                    with open(path, 'a', encoding='utf-8') as f:
-                        f.write(content)
-                else:
-                    with open(path, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                await asyncio.to_thread(_write)
                 return f"Successfully wrote to {path}"
             except Exception as e:
                 raise ValueError(f"Failed to write file: {e}")
@@ -133,17 +135,17 @@ class MCPDesktopServer:
 
             try:
                 items = []
-                for item in os.listdir(path):
-                    item_path = os.path.join(path, item)
-                    is_dir = os.path.isdir(item_path)
-                    size = os.path.getsize(item_path) if not is_dir else 0
-                    modified = datetime.fromtimestamp(os.path.getmtime(item_path)).isoformat()
-                    items.append({
-                        "name": item,
-                        "type": "directory" if is_dir else "file",
-                        "size": size,
-                        "modified": modified
-                    })
+                # One stat per entry; DirEntry caches it for size and mtime
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        st = entry.stat()
+                        is_dir = entry.is_dir()
+                        items.append({
+                            "name": entry.name,
+                            "type": "directory" if is_dir else "file",
+                            "size": st.st_size if not is_dir else 0,
+                            "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
+                        })
                 return json.dumps(items, indent=2)
             except Exception as e:
                 raise ValueError(f"Failed to list directory: {e}")
@@ -291,8 +293,8 @@ class MCPDesktopServer:
                     },
                     "content_stats": {
                         "total_chars": len(content),
-                        "non_empty_lines": len([l for l in lines if l.strip()]),
-                        "avg_line_length": sum(len(l) for l in lines) / len(lines) if lines else 0
+                        "non_empty_lines": len(lines) - lines.count('') - sum(map(str.isspace, lines)),
+                        "avg_line_length": sum(map(len, lines)) / len(lines) if lines else 0
                     }
                 }
 
@@ -313,12 +315,19 @@ class MCPDesktopServer:
                 raise ValueError(f"Access denied: {path}")
 
             try:
-                hash_func = getattr(hashlib, algorithm)()
-                with open(path, 'rb') as f:
-                    while chunk := f.read(8192):
-                        hash_func.update(chunk)
-
-                return f"{algorithm.upper()}: {hash_func.hexdigest()}"
+                with open(path, 'rb', buffering=0) as f:
+                    if hasattr(hashlib, 'file_digest'):
+                        digest = hashlib.file_digest(f, algorithm).hexdigest()
+                    else:
+                        # Reuse one buffer instead of allocating bytes per chunk
+                        hash_func = getattr(hashlib, algorithm)()
+                        buf = bytearray(1 << 20)
+                        view = memoryview(buf)
+                        while n := f.readinto(buf):
+                            hash_func.update(view[:n])
+                        digest = hash_func.hexdigest()
+
+                return f"{algorithm.upper()}: {digest}"
 
             except Exception as e:
                 raise ValueError(f"Failed to calculate file hash: {e}")
@@ -7,6 +7,10 @@ Provides comprehensive web scraping, content analysis, and data extraction capab
 import asyncio
 import logging
 import re
+import time
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
 from typing import Any, Dict, List
 
 import aiohttp
@@ -24,6 +28,31 @@ from selenium.webdriver.support import expected_conditions as EC
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_VOWEL_RUN_RE = re.compile(r'[aeiouy]+')
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+
+# Flesch Reading Ease lower bounds and the level for each band, lowest first
+_READABILITY_THRESHOLDS = (30, 50, 60, 70, 80, 90)
+_READABILITY_LEVELS = (
+    "Very Difficult (College Graduate)",
+    "Difficult (College)",
+    "Fairly Difficult (10th-12th grade)",
+    "Standard (8th-9th grade)",
+    "Fairly Easy (7th grade)",
+    "Easy (6th grade)",
+    "Very Easy (5th grade)",
+)
+
+@lru_cache(maxsize=100_000)
+def _count_syllables_cached(word: str) -> int:
+    """Count syllables in a lowercased word; memoized since words repeat heavily in text."""
+    # Each maximal run of vowels starts one syllable; the regex engine walks
+    # the characters in C instead of a Python-level index loop
+    count = len(_VOWEL_RUN_RE.findall(word))
+    if word.endswith("e"):
+        count -= 1
+    return count if count > 0 else 1
+
 class WebScrapingTool:
     """Advanced web scraping tool with multiple extraction methods."""
 
@@ -293,6 +322,59 @@ class WebScrapingTool:
             logger.error(f"Error analyzing {url}: {str(e)}")
             return {'error': str(e), 'url': url}
 
+    async def analyze_content_many(self, url: str, analysis_types: List[str]) -> Dict[str, Any]:
+        """Run several content analyses on one fetch of the page.
+
+        The performance probe (a second request) and the text-only readability
+        pass run alongside the soup-based analyses instead of after them.
+        """
+        try:
+            async with self.session.get(url) as response:
+                html = await response.text()
+
+            soup = BeautifulSoup(html, 'html.parser')
+            soup_analyses = {
+                'seo': lambda: self._analyze_seo(soup, html),
+                'structure': lambda: self._analyze_structure(soup),
+                'accessibility': lambda: self._analyze_accessibility(soup)
+            }
+
+            metrics = {
+                t: {'error': f"Unknown analysis type: {t}"}
+                for t in analysis_types
+                if t not in soup_analyses and t not in ('performance', 'readability')
+            }
+            tasks = {}
+            if 'performance' in analysis_types:
+                tasks['performance'] = asyncio.create_task(self._analyze_performance(url))
+            if 'readability' in analysis_types:
+                tasks['readability'] = asyncio.create_task(
+                    asyncio.to_thread(self._analyze_readability, soup.get_text())
+                )
+            try:
+                # Let the tasks above start their I/O and thread work, then run the
+                # soup-based analyses here; the soup is not shared across threads
+                await asyncio.sleep(0)
+                for analysis_type in analysis_types:
+                    if analysis_type in soup_analyses:
+                        metrics[analysis_type] = soup_analyses[analysis_type]()
+                results = await asyncio.gather(*tasks.values())
+            except BaseException:
+                for task in tasks.values():
+                    task.cancel()
+                raise
+            metrics.update(zip(tasks, results))
+
+            return {
+                'url': url,
+                'analysis_types': analysis_types,
+                'metrics': {t: metrics[t] for t in analysis_types}
+            }
+
+        except Exception as e:
+            logger.error(f"Error analyzing {url}: {str(e)}")
+            return {'error': str(e), 'url': url}
+
     def _analyze_seo(self, soup: BeautifulSoup, html: str) -> Dict[str, Any]:
         """Analyze SEO metrics."""
         return {
@@ -310,11 +392,13 @@ class WebScrapingTool:
 
     def _analyze_readability(self, text: str) -> Dict[str, Any]:
         """Analyze text readability."""
-        sentences = re.split(r'[.!?]+', text)
+        # Segment count of re.split(r'[.!?]+'), without building the segments
+        sentence_count = len(_SENTENCE_END_RE.findall(text)) + 1
         words = text.split()
-        syllables = sum(self._count_syllables(word) for word in words)
+        # Count each distinct word once and weight by its frequency
+        syllables = sum(self._count_syllables(word) * freq for word, freq in Counter(words).items())
 
-        avg_sentence_length = len(words) / len(sentences) if sentences else 0
+        avg_sentence_length = len(words) / sentence_count
         avg_syllables_per_word = syllables / len(words) if words else 0
 
         # Flesch Reading Ease Score
@@ -325,42 +409,17 @@ class WebScrapingTool:
             'average_sentence_length': round(avg_sentence_length, 2),
             'average_syllables_per_word': round(avg_syllables_per_word, 2),
             'total_words': len(words),
-            'total_sentences': len(sentences),
+            'total_sentences': sentence_count,
             'readability_level': self._get_readability_level(flesch_score)
         }
 
     def _count_syllables(self, word: str) -> int:
         """Count syllables in a word."""
-        word = word.lower()
-        count = 0
-        vowels = "aeiouy"
-        if word[0] in vowels:
-            count += 1
-        for i in range(1, len(word)):
-            if word[i] in vowels and word[i - 1] not in vowels:
-                count += 1
-        if word.endswith("e"):
-            count -= 1
-        if count == 0:
-            count += 1
-        return count
+        return _count_syllables_cached(word.lower())
 
     def _get_readability_level(self, score: float) -> str:
         """Get readability level from Flesch score."""
-        if score >= 90:
-            return "Very Easy (5th grade)"
-        elif score >= 80:
-            return "Easy (6th grade)"
-        elif score >= 70:
-            return "Fairly Easy (7th grade)"
-        elif score >= 60:
-            return "Standard (8th-9th grade)"
-        elif score >= 50:
-            return "Fairly Difficult (10th-12th grade)"
-        elif score >= 30:
-            return "Difficult (College)"
-        else:
-            return "Very Difficult (College Graduate)"
+        return _READABILITY_LEVELS[bisect_right(_READABILITY_THRESHOLDS, score)]
 
     def _analyze_structure(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Analyze page structure."""
@@ -409,10 +468,10 @@ class WebScrapingTool:
     async def _analyze_performance(self, url: str) -> Dict[str, Any]:
         """Analyze page performance (simplified version)."""
         try:
-            start_time = asyncio.get_event_loop().time()
+            start_time = time.perf_counter()
             async with self.session.get(url) as response:
                 content = await response.text()
-            end_time = asyncio.get_event_loop().time()
+            end_time = time.perf_counter()
 
             return {
                 'response_time': round(end_time - start_time, 3),
@@ -484,6 +543,21 @@ async def content_analysis(url: str, analysis_type: str = "seo") -> Dict[str, An
     async with WebScrapingTool() as tool:
         return await tool.analyze_content(url, analysis_type)
 
+@app.tool()
+async def content_analysis_batch(url: str, analysis_types: List[str]) -> Dict[str, Any]:
+    """
+    Run several content analyses on a page concurrently.
+
+    Args:
+        url: URL to analyze
+        analysis_types: Types of analysis (seo, readability, structure, accessibility, performance)
+
+    Returns:
+        Analysis results keyed by analysis type
+    """
+    async with WebScrapingTool() as tool:
+        return await tool.analyze_content_many(url, analysis_types)
+
 # Mount FastMCP app to FastAPI for WebSocket support
 fastapi_app.mount("/mcp", app)
 
@@ -9,6 +9,7 @@ import json
 import logging
 import os
 import sys
+from itertools import islice
 from typing import Any, Dict, List, Optional
 import aiohttp
 from mcp.server.models import InitializationOptions
@@ -198,7 +199,7 @@ class WeatherServer:
                             daily_data[date] = []
                         daily_data[date].append(item)
                     
-                    for i, (date, forecasts) in enumerate(list(daily_data.items())[:days]):
+                    for i, (date, forecasts) in enumerate(islice(daily_data.items(), days)):
                         day_name = "Today" if i == 0 else "Tomorrow" if i == 1 else date.strftime("%A")
                         
                         # Use midday forecast
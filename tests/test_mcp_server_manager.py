@@ -0,0 +1,50 @@
+"""Tests for the MCP server manager's tool parameter validation."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+for _dependency in ("pydantic", "aiohttp", "orjson", "psutil", "fastapi", "mcp.server"):
+    pytest.importorskip(_dependency)
+
+_MANAGER_PATH = Path(__file__).resolve().parents[1] / "mcp" / "backup" / "manager" / "mcp_server_manager.py"
+
+
+@pytest.fixture(scope="module")
+def manager_module():
+    spec = importlib.util.spec_from_file_location("mcp_server_manager", _MANAGER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except ImportError as e:
+        pytest.skip(f"manager dependencies unavailable: {e}")
+    return module
+
+
+@pytest.fixture
+def adapter(manager_module):
+    schema = {
+        "type": "object",
+        "properties": {
+            "operation": {"type": "string", "enum": ["read", "write"]},
+            "path": {"type": "string"},
+            "max_bytes": {"type": "integer"},
+            "recursive": {"type": "boolean"}
+        },
+        "required": ["operation", "path"]
+    }
+    return manager_module._build_param_adapter("file_operations", schema)
+
+
+def test_well_typed_parameters_are_accepted(adapter):
+    params = {"operation": "read", "path": "notes.txt", "max_bytes": 512, "recursive": False}
+    validated = adapter.validate_python(params).model_dump(exclude_unset=True)
+    assert validated == params
+
+
+def test_malformed_parameters_are_rejected_not_coerced(adapter, manager_module):
+    with pytest.raises(manager_module.ValidationError):
+        adapter.validate_python({"operation": "read", "path": "notes.txt", "max_bytes": "5"})
+    with pytest.raises(manager_module.ValidationError):
+        adapter.validate_python({"operation": "read", "path": "notes.txt", "recursive": "yes"})